@@ -10,6 +10,10 @@ import argparse
 import subprocess
 import shutil
 import platform
+import hashlib
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 import io
@@ -20,6 +24,19 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 
+# Nuitka 增量构建目录（位于输出目录下，以入口文件命名）
+# CI 需要在两次构建之间缓存该目录以及 NUITKA_CACHE_DIR
+NUITKA_BUILD_DIR = Path("dist") / "main.build"
+
+# 上次成功构建的指纹记录
+BUILD_STAMP_FILE = Path("dist") / ".build-stamp.json"
+
+# 超过该大小的文件直接交给 hashlib.file_digest 处理（Python 3.11+）
+LARGE_FILE_SIZE = 1024 * 1024
+
+# 构建失败时回显的 Nuitka 输出行数
+FAILURE_TAIL_LINES = 200
+
 
 def detect_platform() -> str:
     """
@@ -39,7 +56,8 @@ def detect_platform() -> str:
         raise ValueError(f"不支持的平台: {system}")
 
 
-def get_nuitka_args(target_platform: str, version: str, enable_upx: bool = True) -> list:
+def get_nuitka_args(target_platform: str, version: str, enable_upx: bool = True,
+                    release: bool = False, fast_rebuild: bool = False) -> list:
     """
     获取 Nuitka 构建参数
 
@@ -47,6 +65,8 @@ def get_nuitka_args(target_platform: str, version: str, enable_upx: bool = True)
         target_platform: 目标平台 (windows/linux/macos)
         version: 版本号
         enable_upx: 是否启用 UPX 压缩
+        release: 是否为发布构建（启用 LTO）
+        fast_rebuild: 是否启用 Nuitka 实验性的源码缓存
 
     Returns:
         Nuitka 参数列表
@@ -71,52 +91,86 @@ def get_nuitka_args(target_platform: str, version: str, enable_upx: bool = True)
         "--noinclude-pytest-mode=nofollow",
         "--noinclude-setuptools-mode=nofollow",
 
+        # 编译设置：并行编译，LTO 仅在发布构建中启用
+        f"--jobs={os.cpu_count() or 4}",
+        f"--lto={'yes' if release else 'no'}",
+
         # 入口文件
         "main.py"
     ]
 
+    # 增量构建：复用上次生成的 C 源码
+    if fast_rebuild:
+        args.insert(-1, "--experimental=source-code-caching")
+
     # UPX 压缩设置
     if enable_upx:
         args.extend([
             "--enable-plugin=upx"
         ])
 
-    # 平台特定设置
+    # 平台特定设置：只检查当前平台对应的图标文件
     if target_platform == "windows":
-        args.extend([
-            "--msvc=latest",
-            "--windows-icon-from-ico=assets/icon.ico" if Path("assets/icon.ico").exists() else None
-        ])
-        # 移除 None 值
-        args = [arg for arg in args if arg is not None]
+        args.append("--msvc=latest")
+        icon = "assets/icon.ico"
+        if os.path.isfile(icon):
+            args.append(f"--windows-icon-from-ico={icon}")
 
     elif target_platform == "linux":
-        args.extend([
-            "--linux-onefile-icon=assets/icon.png" if Path("assets/icon.png").exists() else None
-        ])
-        # 移除 None 值
-        args = [arg for arg in args if arg is not None]
+        icon = "assets/icon.png"
+        if os.path.isfile(icon):
+            args.append(f"--linux-onefile-icon={icon}")
 
     elif target_platform == "macos":
-        args.extend([
-            "--macos-app-icon=assets/icon.icns" if Path("assets/icon.icns").exists() else None,
-            "--macos-create-app-bundle"
-        ])
-        # 移除 None 值
-        args = [arg for arg in args if arg is not None]
+        icon = "assets/icon.icns"
+        if os.path.isfile(icon):
+            args.append(f"--macos-app-icon={icon}")
+        args.append("--macos-create-app-bundle")
 
     return args
 
 
-def clean_build_dir():
-    """清理构建目录"""
-    build_dirs = ["build", "dist", "EdgeCLI.build", "EdgeCLI.dist", "EdgeCLI.onefile-build"]
+def setup_build_cache():
+    """设置 Nuitka 缓存目录，使 ccache 等缓存可跨构建复用"""
+    cache_dir = os.environ.setdefault(
+        "NUITKA_CACHE_DIR", str(Path.home() / ".cache" / "nuitka")
+    )
+    print(f"🗄️  Nuitka 缓存目录: {cache_dir}")
+    if shutil.which("ccache") is None:
+        print("⚠️  未检测到 ccache，C 编译结果将无法缓存")
+
+
+def clean_build_dir(full_clean: bool = False):
+    """
+    清理构建目录
+
+    Args:
+        full_clean: 是否同时删除 Nuitka 增量构建目录
+    """
+    build_dirs = ["build", "EdgeCLI.dist", "EdgeCLI.onefile-build"]
+    if full_clean:
+        build_dirs.extend(["dist", "EdgeCLI.build"])
 
     for build_dir in build_dirs:
         if Path(build_dir).exists():
             print(f"🧹 清理目录: {build_dir}")
             shutil.rmtree(build_dir)
 
+    if full_clean:
+        return
+
+    # 保留增量构建目录，仅清理 dist 中的其余产物
+    dist_dir = Path("dist")
+    if dist_dir.is_dir():
+        for entry in dist_dir.iterdir():
+            if entry == NUITKA_BUILD_DIR:
+                continue
+            print(f"🧹 清理: {entry}")
+            if entry.is_dir():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+
 
 def create_dist_dir():
     """创建输出目录"""
@@ -125,7 +179,8 @@ def create_dist_dir():
     return dist_dir
 
 
-def build_with_nuitka(target_platform: str, version: str, enable_upx: bool = True) -> bool:
+def build_with_nuitka(target_platform: str, version: str, enable_upx: bool = True,
+                      release: bool = False, fast_rebuild: bool = False) -> bool:
     """
     使用 Nuitka 构建项目
 
@@ -133,6 +188,8 @@ def build_with_nuitka(target_platform: str, version: str, enable_upx: bool = Tru
         target_platform: 目标平台
         version: 版本号
         enable_upx: 是否启用 UPX 压缩
+        release: 是否为发布构建
+        fast_rebuild: 是否启用源码缓存
 
     Returns:
         构建是否成功
@@ -141,27 +198,163 @@ def build_with_nuitka(target_platform: str, version: str, enable_upx: bool = Tru
     if enable_upx:
         print("📦 启用 UPX 压缩")
 
+    # 设置构建缓存
+    setup_build_cache()
+
     # 获取构建参数
-    nuitka_args = get_nuitka_args(target_platform, version, enable_upx)
+    nuitka_args = get_nuitka_args(
+        target_platform, version, enable_upx, release, fast_rebuild
+    )
 
     print("📋 Nuitka 构建参数:")
     for arg in nuitka_args:
         if arg.startswith("--"):
             print(f"  {arg}")
 
-    # 执行构建
+    # 执行构建，实时转发输出并保留末尾若干行用于失败诊断
+    print("\n🚀 执行 Nuitka 构建...")
+    tail = deque(maxlen=FAILURE_TAIL_LINES)
     try:
-        print("\n🚀 执行 Nuitka 构建...")
-        subprocess.run(nuitka_args, check=True, text=True, stdout=sys.stdout)
-        print("✅ Nuitka 构建成功!")
-        return True
+        with subprocess.Popen(
+            nuitka_args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            encoding="utf-8",
+            errors="replace"
+        ) as proc:
+            for line in proc.stdout:
+                print(line, end="")
+                tail.append(line)
+            returncode = proc.wait()
+    except OSError as e:
+        print(f"❌ 无法启动 Nuitka: {e}")
+        return False
 
-    except subprocess.CalledProcessError as e:
+    if returncode != 0:
         print(f"❌ Nuitka 构建失败!")
-        print(f"错误代码: {e.returncode}")
-        print(f"错误输出: {e.stderr}")
+        print(f"错误代码: {returncode}")
+        print(f"错误输出（最后 {len(tail)} 行）:")
+        print("".join(tail), end="")
         return False
 
+    print("✅ Nuitka 构建成功!")
+    return True
+
+
+def get_executable_path(target_platform: str) -> Path:
+    """
+    获取构建产物路径
+
+    Args:
+        target_platform: 目标平台
+
+    Returns:
+        可执行文件路径
+    """
+    executable_name = "EdgeCLI.exe" if target_platform == "windows" else "EdgeCLI"
+    return Path("dist") / executable_name
+
+
+def get_nuitka_version() -> str:
+    """
+    获取 Nuitka 版本
+
+    Returns:
+        版本输出，获取失败时返回空字符串
+    """
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "nuitka", "--version"],
+            capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _hash_file(path: Path) -> bytes:
+    """
+    计算单个文件的 blake2b 摘要
+
+    Args:
+        path: 文件路径
+
+    Returns:
+        摘要字节
+    """
+    if hasattr(hashlib, "file_digest") and path.stat().st_size > LARGE_FILE_SIZE:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "blake2b").digest()
+    return hashlib.blake2b(path.read_bytes()).digest()
+
+
+def compute_source_fingerprint(nuitka_args: list) -> str:
+    """
+    计算源码指纹（源文件内容 + Nuitka 版本 + 构建参数）
+
+    Args:
+        nuitka_args: Nuitka 参数列表
+
+    Returns:
+        十六进制指纹
+    """
+    files = sorted(Path("edgecli").rglob("*.py"))
+    files.append(Path("main.py"))
+
+    # 并行读取与哈希，重叠磁盘 I/O 延迟
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        digests = list(executor.map(_hash_file, files))
+
+    hasher = hashlib.blake2b()
+    for path, digest in zip(files, digests):
+        hasher.update(str(path).encode())
+        hasher.update(digest)
+
+    hasher.update(get_nuitka_version().encode())
+    hasher.update("\0".join(nuitka_args).encode())
+    return hasher.hexdigest()
+
+
+def is_build_up_to_date(target_platform: str, fingerprint: str) -> bool:
+    """
+    检查上次成功构建是否与当前指纹一致
+
+    Args:
+        target_platform: 目标平台
+        fingerprint: 当前源码指纹
+
+    Returns:
+        是否无需重新构建
+    """
+    executable_path = get_executable_path(target_platform)
+    if not executable_path.exists():
+        return False
+
+    try:
+        stamp = json.loads(BUILD_STAMP_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+
+    return (stamp.get("fingerprint") == fingerprint and
+            stamp.get("executable_mtime") == executable_path.stat().st_mtime)
+
+
+def write_build_stamp(target_platform: str, fingerprint: str) -> None:
+    """
+    记录成功构建的指纹
+
+    Args:
+        target_platform: 目标平台
+        fingerprint: 源码指纹
+    """
+    stamp = {
+        "fingerprint": fingerprint,
+        "executable_mtime": get_executable_path(target_platform).stat().st_mtime,
+    }
+    BUILD_STAMP_FILE.write_text(json.dumps(stamp), encoding="utf-8")
+
 
 def verify_build(target_platform: str) -> bool:
     """
@@ -173,8 +366,7 @@ def verify_build(target_platform: str) -> bool:
     Returns:
         验证是否成功
     """
-    executable_name = "EdgeCLI.exe" if target_platform == "windows" else "EdgeCLI"
-    executable_path = Path("dist") / executable_name
+    executable_path = get_executable_path(target_platform)
 
     if not executable_path.exists():
         print(f"❌ 可执行文件不存在: {executable_path}")
@@ -200,8 +392,12 @@ def main():
     """主函数"""
     parser = argparse.ArgumentParser(description="EdgeCLI 构建脚本")
     parser.add_argument("--version", required=True, help="版本号")
-    parser.add_argument("--clean", action="store_true", help="构建前清理")
+    parser.add_argument("--clean", action="store_true", help="构建前清理（保留增量构建目录）")
+    parser.add_argument("--full-clean", action="store_true", help="构建前完全清理，包括增量构建目录")
+    parser.add_argument("--fast-rebuild", action="store_true", help="启用 Nuitka 源码缓存加速重复构建")
     parser.add_argument("--no-upx", action="store_true", help="禁用 UPX 压缩")
+    parser.add_argument("--release", action="store_true", help="发布构建（启用 LTO）")
+    parser.add_argument("--force", action="store_true", help="忽略构建指纹，强制重新构建")
 
     args = parser.parse_args()
 
@@ -212,24 +408,36 @@ def main():
     print(f"检测到平台: {current_platform}")
     print(f"版本: {args.version}")
     print(f"UPX 压缩: {'禁用' if args.no_upx else '启用'}")
+    print(f"构建类型: {'发布' if args.release else '开发'}")
     print("-" * 50)
 
     # 清理构建目录
-    if args.clean:
-        clean_build_dir()
+    if args.clean or args.full_clean:
+        clean_build_dir(args.full_clean)
 
     # 创建输出目录
     create_dist_dir()
 
-    # 执行构建
+    # 源码未变化时跳过构建
     enable_upx = not args.no_upx
-    if not build_with_nuitka(current_platform, args.version, enable_upx):
+    fingerprint = compute_source_fingerprint(get_nuitka_args(
+        current_platform, args.version, enable_upx, args.release, args.fast_rebuild
+    ))
+    if not args.force and is_build_up_to_date(current_platform, fingerprint):
+        print("✅ 源码未变化，构建结果已是最新")
+        return
+
+    # 执行构建
+    if not build_with_nuitka(current_platform, args.version, enable_upx,
+                             args.release, args.fast_rebuild):
         sys.exit(1)
 
     # 验证构建结果
     if not verify_build(current_platform):
         sys.exit(1)
 
+    write_build_stamp(current_platform, fingerprint)
+
     print("\n🎉 构建完成!")
 
 
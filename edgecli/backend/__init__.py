@@ -14,13 +14,22 @@ from .core.proxy_manager import ProxyManager
 from .models.server_config import ServerConfig
 from .models.client_config import ClientConfig
 
-from .services.crypto_service import CryptoService
-from .services.dns_service import DNSService
-from .services.link_service import LinkService
+# 服务依赖 cryptography / dnspython，导入较慢，首次访问时再加载
+_LAZY_EXPORTS = ('CryptoService', 'DNSService', 'LinkService')
+
+
+def __getattr__(name):
+    """首次访问时从 services 包加载服务类"""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import services
+    value = getattr(services, name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'ConfigManager',
-    'XRayManager', 
+    'XRayManager',
     'ProxyManager',
     'ServerConfig',
     'ClientConfig',
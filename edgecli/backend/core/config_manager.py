@@ -6,7 +6,7 @@ Configuration Manager
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..utils.system_utils import SystemUtils
 
@@ -24,6 +24,14 @@ class ConfigManager:
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
         self.system_utils = SystemUtils()
+        
+        # 配置列表缓存: 配置类型 -> (目录 mtime_ns, 配置名称列表)
+        self._list_cache: Dict[str, Tuple[int, List[str]]] = {}
+    
+    def _invalidate_list_cache(self) -> None:
+        """使配置列表缓存失效"""
+        for config_type in ("server", "client"):
+            self._list_cache[config_type] = (-1, [])
     
     def list_configs(self, config_type: str) -> List[str]:
         """
@@ -35,15 +43,25 @@ class ConfigManager:
         Returns:
             配置名称列表
         """
-        pattern = f"*_{config_type}.json"
-        configs = []
-        
-        for config_file in self.config_dir.glob(pattern):
-            # 提取配置名称（移除后缀）
-            config_name = config_file.stem.replace(f"_{config_type}", "")
-            configs.append(config_name)
-        
-        return sorted(configs)
+        # 目录未发生变化时直接返回缓存结果
+        dir_mtime = self.config_dir.stat().st_mtime_ns
+        cached = self._list_cache.get(config_type)
+        if cached is not None and cached[0] == dir_mtime:
+            return list(cached[1])
+        
+        # 一次扫描同时归类所有配置类型，随后列出其他类型时直接命中缓存
+        suffixes = {t: f"_{t}.json" for t in ("server", "client", config_type)}
+        buckets: Dict[str, List[str]] = {t: [] for t in suffixes}
+        with os.scandir(self.config_dir) as it:
+            for entry in it:
+                for t, suffix in suffixes.items():
+                    if entry.name.endswith(suffix) and entry.is_file():
+                        buckets[t].append(entry.name[:-len(suffix)])
+        
+        for t, configs in buckets.items():
+            configs.sort()
+            self._list_cache[t] = (dir_mtime, configs)
+        return list(buckets[config_type])
     
     def config_exists(self, config_name: str, config_type: str) -> bool:
         """
@@ -96,6 +114,7 @@ class ConfigManager:
         
         try:
             self.system_utils.save_json_config(config, str(config_path))
+            self._invalidate_list_cache()
             return True
         except Exception as e:
             raise ValueError(f"保存配置失败: {str(e)}")
@@ -118,6 +137,7 @@ class ConfigManager:
         
         try:
             config_path.unlink()
+            self._invalidate_list_cache()
             return True
         except Exception:
             return False
@@ -138,6 +158,7 @@ class ConfigManager:
         
         try:
             self.system_utils.save_json_config(xray_config, str(xray_config_path))
+            self._invalidate_list_cache()
             return str(xray_config_path)
         except Exception as e:
             raise ValueError(f"保存 XRay 配置失败: {str(e)}")
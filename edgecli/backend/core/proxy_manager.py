@@ -3,7 +3,7 @@ Proxy Manager
 代理管理器 - 统一管理服务端和客户端代理
 """
 
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from .config_manager import ConfigManager
 from .xray_manager import XRayManager
 from ..models.server_config import ServerConfig
@@ -101,13 +101,15 @@ class ProxyManager:
         """
         return self.config_manager.save_config(config.to_dict(), config_name, "client")
     
-    def start_server(self, config: ServerConfig, config_name: str) -> bool:
+    def start_server(self, config: ServerConfig, config_name: str,
+                     on_exit: Optional[Callable[[], None]] = None) -> bool:
         """
         启动服务端
         
         Args:
             config: 服务端配置
             config_name: 配置名称
+            on_exit: XRay 进程退出时的回调
             
         Returns:
             是否成功启动
@@ -120,8 +122,9 @@ class ProxyManager:
             xray_config, config_name, "server"
         )
         
-        # 启动 XRay
-        if self.xray_manager.start_xray(xray_config_path):
+        # 启动 XRay，以生成配置中的入站端口作为就绪探测端口
+        port = xray_config["inbounds"][0]["port"]
+        if self.xray_manager.start_xray(xray_config_path, port, on_exit):
             self.current_config = config
             self.current_config_name = config_name
             self.current_mode = "server"
@@ -129,13 +132,15 @@ class ProxyManager:
         
         return False
     
-    def start_client(self, config: ClientConfig, config_name: str) -> bool:
+    def start_client(self, config: ClientConfig, config_name: str,
+                     on_exit: Optional[Callable[[], None]] = None) -> bool:
         """
         启动客户端
         
         Args:
             config: 客户端配置
             config_name: 配置名称
+            on_exit: XRay 进程退出时的回调
             
         Returns:
             是否成功启动
@@ -149,7 +154,7 @@ class ProxyManager:
         )
         
         # 启动 XRay
-        if self.xray_manager.start_xray(xray_config_path):
+        if self.xray_manager.start_xray(xray_config_path, config.local_port, on_exit):
             self.current_config = config
             self.current_config_name = config_name
             self.current_mode = "client"
@@ -198,6 +203,8 @@ class ProxyManager:
         """
         列出所有服务端配置
         
+        结果由 ConfigManager 按配置目录 mtime 缓存，菜单反复进入时不会重复扫描目录
+        
         Returns:
             配置名称列表
         """
@@ -207,6 +214,8 @@ class ProxyManager:
         """
         列出所有客户端配置
         
+        结果由 ConfigManager 按配置目录 mtime 缓存，菜单反复进入时不会重复扫描目录
+        
         Returns:
             配置名称列表
         """
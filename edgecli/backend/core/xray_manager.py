@@ -3,18 +3,70 @@ XRay Manager
 XRay 管理器 - 负责 XRay 二进制文件的下载、管理和进程控制
 """
 
+import json
 import os
+import shutil
 import subprocess
 import requests
 import zipfile
 import tarfile
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 import signal
+import socket
 import time
 
 from ..utils.system_utils import SystemUtils
 
+# 下载与解压时的复制缓冲区大小
+_COPY_BUFSIZE = 1024 * 1024
+
+# 获取远端元数据的 HEAD 请求超时（秒）
+_HEAD_TIMEOUT = 10
+
+# 下载进度上报间隔（秒）
+_PROGRESS_INTERVAL = 0.25
+
+# 启动探测的轮询间隔与最长等待时间（秒）
+_STARTUP_POLL_INTERVAL = 0.02
+_STARTUP_TIMEOUT = 2.0
+
+
+class _CountingReader:
+    """统计已读取字节数的读取包装器"""
+    
+    def __init__(self, raw):
+        self._raw = raw
+        self.count = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self.count += len(data)
+        return data
+
+
+def _report_progress(stop_event: threading.Event, reader: _CountingReader,
+                     total_size: int, progress_callback) -> None:
+    """定时上报下载进度，直到 stop_event 被设置"""
+    while not stop_event.wait(_PROGRESS_INTERVAL):
+        progress_callback(min(reader.count / total_size * 100, 100.0))
+
+
+def _port_accepts_connection(port: int, timeout: float) -> bool:
+    """检查本地端口是否可连接"""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _watch_exit(process: subprocess.Popen, on_exit: Callable[[], None]) -> None:
+    """阻塞等待 XRay 进程退出，随后通知调用方"""
+    process.wait()
+    on_exit()
+
 
 class XRayManager:
     """XRay 管理器"""
@@ -37,6 +89,9 @@ class XRayManager:
         else:
             self.xray_binary = self.bin_dir / "xray"
         
+        # 已安装版本的下载元数据（ETag / Content-Length）
+        self._meta_path = self.bin_dir / ".xray.meta.json"
+        
         self.xray_process = None
         
     def check_xray_binary(self) -> bool:
@@ -87,6 +142,9 @@ class XRayManager:
         """
         下载 XRay 二进制文件
         
+        已安装版本与远端 ETag 一致时跳过下载。目前唯一的调用方只在
+        二进制文件缺失时下载，该分支留给之后的更新检查等调用方使用。
+        
         Args:
             progress_callback: 进度回调函数
             
@@ -96,25 +154,68 @@ class XRayManager:
         try:
             download_url = self.get_download_url()
             
+            # 先用 HEAD 获取远端元数据，与已安装版本一致时跳过下载；
+            # HEAD 仅作参考，失败或被拒绝（如代理返回 403/405）时直接下载
+            remote_meta = {"url": download_url, "etag": None, "content_length": None}
+            try:
+                head = requests.head(download_url, allow_redirects=True, timeout=_HEAD_TIMEOUT)
+                if 200 <= head.status_code < 300:
+                    remote_meta["etag"] = head.headers.get('etag')
+                    remote_meta["content_length"] = head.headers.get('content-length')
+            except Exception:
+                pass
+            if remote_meta["etag"] and self.check_xray_binary() \
+                    and self._load_meta() == remote_meta:
+                if progress_callback:
+                    progress_callback(100.0)
+                return True
+            
+            # 临时文件残留时尝试断点续传（If-Range 保证远端未变化）
+            temp_file = self.bin_dir / "xray_temp.zip"
+            offset = temp_file.stat().st_size if temp_file.exists() else 0
+            headers = {}
+            if offset and remote_meta["etag"]:
+                headers['Range'] = f"bytes={offset}-"
+                headers['If-Range'] = remote_meta["etag"]
+            
             # 下载文件
-            response = requests.get(download_url, stream=True)
+            response = requests.get(download_url, stream=True, headers=headers)
+            if response.status_code == 416:
+                # 残留文件已不匹配任何可续传范围，重新完整下载
+                response.close()
+                response = requests.get(download_url, stream=True)
             response.raise_for_status()
+            response.raw.decode_content = True
             
-            # 保存到临时文件
-            temp_file = self.bin_dir / "xray_temp.zip"
+            if response.status_code != 206:
+                offset = 0
+            
+            total_size = int(response.headers.get('content-length', 0)) + offset
+            reader = _CountingReader(response.raw)
+            reader.count = offset
             
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
+            # 进度由后台线程定时上报，与写盘解耦
+            stop_event = threading.Event()
+            reporter = None
+            if progress_callback and total_size > 0:
+                reporter = threading.Thread(
+                    target=_report_progress,
+                    args=(stop_event, reader, total_size, progress_callback),
+                    daemon=True
+                )
+                reporter.start()
+            
+            try:
+                with open(temp_file, 'ab' if offset else 'wb') as f:
+                    shutil.copyfileobj(reader, f, _COPY_BUFSIZE)
+            finally:
+                stop_event.set()
+                if reporter is not None:
+                    reporter.join()
+                response.close()
             
-            with open(temp_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if progress_callback and total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            progress_callback(progress)
+            if reporter is not None:
+                progress_callback(min(reader.count / total_size * 100, 100.0))
             
             # 解压文件
             self._extract_xray(temp_file)
@@ -126,11 +227,35 @@ class XRayManager:
             if self.platform != "windows":
                 os.chmod(self.xray_binary, 0o755)
             
+            self._save_meta(remote_meta)
             return True
             
         except Exception as e:
             return False
     
+    def _load_meta(self) -> Optional[dict]:
+        """
+        读取已安装版本的下载元数据
+        
+        Returns:
+            元数据字典或 None
+        """
+        try:
+            with open(self._meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_meta(self, meta: dict) -> None:
+        """
+        保存已安装版本的下载元数据
+        
+        Args:
+            meta: 元数据字典
+        """
+        with open(self._meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+    
     def _extract_xray(self, archive_path: Path) -> None:
         """
         解压 XRay 文件
@@ -140,31 +265,35 @@ class XRayManager:
         """
         if archive_path.suffix == '.zip':
             with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                # 查找 xray 可执行文件
-                for file_info in zip_ref.filelist:
-                    if file_info.filename.endswith(('xray', 'xray.exe')):
-                        # 提取到指定位置
-                        with zip_ref.open(file_info) as source:
-                            with open(self.xray_binary, 'wb') as target:
-                                target.write(source.read())
-                        break
+                # 按名称查找 xray 可执行文件，并直接写入标准名称
+                name = next(
+                    (n for n in zip_ref.namelist() if n.endswith(('xray', 'xray.exe'))),
+                    None
+                )
+                if name is not None:
+                    with zip_ref.open(name) as source, \
+                            open(self.xray_binary, 'wb') as target:
+                        shutil.copyfileobj(source, target, _COPY_BUFSIZE)
         else:
             # 处理 tar.gz 文件
             with tarfile.open(archive_path, 'r:gz') as tar_ref:
                 for member in tar_ref.getmembers():
-                    if member.name.endswith(('xray', 'xray.exe')):
-                        tar_ref.extract(member, self.bin_dir)
-                        # 重命名为标准名称
-                        extracted_path = self.bin_dir / member.name
-                        extracted_path.rename(self.xray_binary)
+                    if member.isfile() and member.name.endswith(('xray', 'xray.exe')):
+                        # 直接写入标准名称，无需先解压再重命名
+                        with tar_ref.extractfile(member) as source:
+                            with open(self.xray_binary, 'wb') as target:
+                                shutil.copyfileobj(source, target, _COPY_BUFSIZE)
                         break
     
-    def start_xray(self, config_path: str) -> bool:
+    def start_xray(self, config_path: str, port: Optional[int] = None,
+                   on_exit: Optional[Callable[[], None]] = None) -> bool:
         """
         启动 XRay 进程
         
         Args:
             config_path: 配置文件路径
+            port: XRay 监听的本地端口，提供时以端口可连接作为就绪信号
+            on_exit: 进程退出时在后台线程中调用的回调
             
         Returns:
             是否成功启动
@@ -172,29 +301,74 @@ class XRayManager:
         if not self.check_xray_binary():
             return False
         
+        # 端口已被其他程序占用时 XRay 会绑定失败，端口探测无法区分，
+        # 此时退回到超时后检查进程存活
+        if port is not None and _port_accepts_connection(port, _STARTUP_POLL_INTERVAL):
+            port = None
+        
         try:
             # 构建命令
             cmd = [str(self.xray_binary), "run", "-config", config_path]
             
-            # 启动进程
+            # 启动进程：输出无人读取，重定向到 DEVNULL，
+            # 避免管道写满（约 64 KiB）后 XRay 阻塞、停止时只能强杀
             self.xray_process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=str(self.bin_dir.parent)
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=str(self.bin_dir.parent),
+                **self._process_group_kwargs()
             )
             
-            # 等待一小段时间检查是否启动成功
-            time.sleep(1)
+            # 由后台线程阻塞在 wait() 上，进程退出时回调，调用方无需轮询
+            if on_exit is not None:
+                threading.Thread(
+                    target=_watch_exit,
+                    args=(self.xray_process, on_exit),
+                    daemon=True
+                ).start()
             
-            if self.xray_process.poll() is None:
-                return True
-            else:
-                return False
+            return self._wait_for_startup(port)
                 
         except Exception as e:
             return False
     
+    def _process_group_kwargs(self) -> dict:
+        """
+        获取让 XRay 独立成进程组的 Popen 参数
+        
+        Returns:
+            Popen 关键字参数
+        """
+        if self.platform == "windows":
+            return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        return {"start_new_session": True}
+    
+    def _wait_for_startup(self, port: Optional[int]) -> bool:
+        """
+        短间隔轮询等待 XRay 就绪
+        
+        客户端的端口为 dokodemo-door 入站，每次探测连接都会让 XRay
+        向远端服务器发起一次连接。
+        
+        Args:
+            port: XRay 监听的本地端口，为 None 时仅在超时后检查进程存活
+            
+        Returns:
+            进程是否仍在运行
+        """
+        deadline = time.monotonic() + _STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.xray_process.poll() is not None:
+                return False
+            
+            if port is not None and _port_accepts_connection(port, _STARTUP_POLL_INTERVAL):
+                return True
+            
+            time.sleep(_STARTUP_POLL_INTERVAL)
+        
+        return self.xray_process.poll() is None
+    
     def stop_xray(self) -> bool:
         """
         停止 XRay 进程
@@ -206,18 +380,12 @@ class XRayManager:
             return True
         
         try:
-            # 发送终止信号
-            if self.platform == "windows":
-                self.xray_process.terminate()
-            else:
-                self.xray_process.send_signal(signal.SIGTERM)
-            
-            # 等待进程结束
+            # 先整组发送终止信号，超时后整组强制杀死
+            self._signal_xray(force=False)
             try:
-                self.xray_process.wait(timeout=5)
+                self.xray_process.wait(timeout=1.0)
             except subprocess.TimeoutExpired:
-                # 强制杀死进程
-                self.xray_process.kill()
+                self._signal_xray(force=True)
                 self.xray_process.wait()
             
             self.xray_process = None
@@ -226,6 +394,32 @@ class XRayManager:
         except Exception as e:
             return False
     
+    def _signal_xray(self, force: bool) -> None:
+        """
+        向 XRay 进程组发送终止信号
+        
+        Args:
+            force: 是否强制杀死（SIGKILL），否则发送 SIGTERM
+        """
+        # 进程已被回收（如后台监视线程）时 PID 可能已被复用，不能再发送信号
+        if self.xray_process.poll() is not None:
+            return
+        
+        if self.platform == "windows":
+            if force:
+                self.xray_process.kill()
+            else:
+                self.xray_process.terminate()
+            return
+        
+        sig = signal.SIGKILL if force else signal.SIGTERM
+        try:
+            # start_new_session 使 XRay 成为进程组组长，组 ID 即其 PID
+            os.killpg(self.xray_process.pid, sig)
+        except ProcessLookupError:
+            # 进程已退出，等待回收即可
+            pass
+    
     def is_running(self) -> bool:
         """
         检查 XRay 是否正在运行
@@ -3,19 +3,147 @@ Client Configuration Model
 客户端配置数据模型
 """
 
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+import json
+from typing import Dict, Any, Iterator, List, Optional
+from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # 可选依赖，缺失时回退到标准库 json
+    orjson = None
 
-@dataclass
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False).encode('utf-8')
+    _loads = json.loads
+
+# XRay 客户端配置模板，可变字段以占位符表示
+_XRAY_TEMPLATE: Dict[str, Any] = {
+    "log": {
+        "loglevel": "warning"
+    },
+    "inbounds": [
+        {
+            "listen": "127.0.0.1",
+            "port": "__LOCAL_PORT__",
+            "protocol": "dokodemo-door",
+            "settings": {
+                "address": "127.0.0.1",
+                "port": 25565,
+                "network": "tcp"
+            }
+        }
+    ],
+    "outbounds": [
+        {
+            "protocol": "vless",
+            "settings": {
+                "vnext": [
+                    {
+                        "address": "__REMOTE_DOMAIN__",
+                        "port": "__SERVER_PORT__",
+                        "users": [
+                            {
+                                "id": "__SERVER_ID__",
+                                "encryption": "none"
+                            }
+                        ]
+                    }
+                ]
+            },
+            "streamSettings": {
+                "network": "xhttp",
+                "security": "tls",
+                "xhttpSettings": {
+                    "host": "__REMOTE_DOMAIN__",
+                    "mode": "auto",
+                    "path": "__SERVER_PATH__",
+                    "extra": {
+                        "scMaxEachPostBytes": "1000000-10000000",
+                        "scMinPostsIntervalMs": "0-100"
+                    }
+                },
+                "tlsSettings": {
+                    "serverName": "__REMOTE_DOMAIN__",
+                    "allowInsecure": True,
+                    "fingerprint": "chrome",
+                    "alpn": [
+                        "h3",
+                        "h2"
+                    ]
+                }
+            }
+        }
+    ]
+}
+_XRAY_TEMPLATE_JSON = _dumps(_XRAY_TEMPLATE)
+
+# 服务器配置必需字段（按报错顺序排列）
+_REQUIRED_SERVER_FIELD_ORDER = ('id', 'domain', 'protocol', 'port')
+_REQUIRED_SERVER_FIELDS = frozenset(_REQUIRED_SERVER_FIELD_ORDER)
+
+try:
+    import fastjsonschema
+except ImportError:  # 可选依赖，缺失时仅使用逐项检查
+    fastjsonschema = None
+
+# 配置结构约束，仅作为快速通过路径；不通过时再逐项检查以生成错误信息，
+# 因此该约束必须不比 _iter_errors 宽松
+_SCHEMA = {
+    "type": "object",
+    "required": ["name", "remote_domain", "local_port", "server_config"],
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "remote_domain": {"type": "string", "minLength": 1},
+        "local_port": {"type": "integer", "minimum": 1, "maximum": 65535},
+        "server_config": {
+            "type": "object",
+            "required": list(_REQUIRED_SERVER_FIELD_ORDER),
+        },
+    },
+}
+
+if fastjsonschema is not None:
+    _schema_validate = fastjsonschema.compile(_SCHEMA)
+    _SchemaError = fastjsonschema.JsonSchemaException
+else:
+    _schema_validate = None
+
+
+@dataclass(frozen=True)
 class ClientConfig:
     """客户端配置模型"""
     
+    # 手写 __slots__ 以兼容 Python 3.8/3.9（dataclass 的 slots 参数需要 3.10+）
+    __slots__ = ('name', 'remote_domain', 'local_port', 'server_config',
+                 '_xray_key', '_xray_cache')
+    
+    # server_config 为字典，实例不可哈希；显式声明以免 hash() 报出字段层面的错误
+    __hash__ = None
+    
     name: str
     remote_domain: str
     local_port: int
     server_config: Dict[str, Any]
     
+    def __post_init__(self) -> None:
+        # generate_xray_config 结果缓存（不属于数据字段）
+        object.__setattr__(self, '_xray_key', None)
+        object.__setattr__(self, '_xray_cache', None)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """复制与序列化时只保留数据字段"""
+        return self.to_dict()
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """恢复数据字段（实例为 frozen，需绕过 __setattr__），缓存置空"""
+        for field_name, value in state.items():
+            object.__setattr__(self, field_name, value)
+        self.__post_init__()
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ClientConfig':
         """
@@ -41,74 +169,57 @@ class ClientConfig:
         Returns:
             配置数据字典
         """
-        return asdict(self)
+        return {
+            'name': self.name,
+            'remote_domain': self.remote_domain,
+            'local_port': self.local_port,
+            'server_config': self.server_config
+        }
     
     def generate_xray_config(self) -> Dict[str, Any]:
         """
         生成 XRay 客户端配置
         
+        结果按参与生成的字段缓存，字段未变化时直接返回上次的结果，
+        调用方不应修改返回的字典。
+        
         Returns:
             XRay 配置字典
         """
-        return {
-            "log": {
-                "loglevel": "warning"
-            },
-            "inbounds": [
-                {
-                    "listen": "127.0.0.1",
-                    "port": self.local_port,
-                    "listen": "127.0.0.1",
-                    "protocol": "dokodemo-door",
-                    "settings": {
-                        "address": "127.0.0.1",
-                        "port": 25565,
-                        "network": "tcp"
-                    }
-                }
-            ],
-            "outbounds": [
-                {
-                    "protocol": "vless",
-                    "settings": {
-                        "vnext": [
-                            {
-                                "address": self.remote_domain,
-                                "port": self.server_config.get("port", 443),
-                                "users": [
-                                    {
-                                        "id": self.server_config["id"],
-                                        "encryption": "none"
-                                    }
-                                ]
-                            }
-                        ]
-                    },
-                    "streamSettings": {
-                        "network": "xhttp",
-                        "security": "tls",
-                        "xhttpSettings": {
-                            "host": self.remote_domain,
-                            "mode": "auto",
-                            "path": self.server_config.get("path", "/mcproxy"),
-                            "extra": {
-                                "scMaxEachPostBytes": "1000000-10000000",
-                                "scMinPostsIntervalMs": "0-100"
-                            }
-                        },
-                        "tlsSettings": {
-                            "serverName": self.remote_domain,
-                            "allowInsecure": True,
-                            "fingerprint": "chrome",
-                            "alpn": [
-                                "h3",
-                                "h2"
-                            ]
-                        }
-                    }
-                }
-            ]
-        }
+        key = (
+            self.remote_domain,
+            self.local_port,
+            self.server_config.get("id"),
+            self.server_config.get("port", 443),
+            self.server_config.get("path", "/mcproxy"),
+        )
+        if self._xray_cache is not None and self._xray_key == key:
+            return self._xray_cache
+        
+        # 实例为 frozen，缓存字段需绕过 __setattr__ 写入
+        cache = self._build_xray_config()
+        object.__setattr__(self, '_xray_cache', cache)
+        object.__setattr__(self, '_xray_key', key)
+        return cache
+    
+    def _build_xray_config(self) -> Dict[str, Any]:
+        """
+        构建 XRay 客户端配置字典
+        
+        Returns:
+            XRay 配置字典
+        """
+        # 占位符替换为 JSON 编码后的值，反序列化一次即得到全新的可变字典
+        data = _XRAY_TEMPLATE_JSON
+        for token, value in (
+            (b'"__LOCAL_PORT__"', self.local_port),
+            (b'"__REMOTE_DOMAIN__"', self.remote_domain),
+            (b'"__SERVER_PORT__"', self.server_config.get("port", 443)),
+            (b'"__SERVER_ID__"', self.server_config["id"]),
+            (b'"__SERVER_PATH__"', self.server_config.get("path", "/mcproxy")),
+        ):
+            data = data.replace(token, _dumps(value))
+        return _loads(data)
     
     def get_local_address(self) -> str:
         """
@@ -134,34 +245,57 @@ class ClientConfig:
             "path": self.server_config.get("path", "/mcproxy")
         }
     
-    def validate(self) -> List[str]:
+    def _iter_errors(self) -> Iterator[str]:
         """
-        验证配置
+        逐条生成验证错误
         
-        Returns:
-            错误信息列表
+        Yields:
+            错误信息
         """
-        errors = []
-        
         if not self.name:
-            errors.append("配置名称不能为空")
+            yield "配置名称不能为空"
         
         if not self.remote_domain:
-            errors.append("远程域名不能为空")
+            yield "远程域名不能为空"
         
         if not (1 <= self.local_port <= 65535):
-            errors.append("本地端口必须在 1-65535 范围内")
+            yield "本地端口必须在 1-65535 范围内"
         
         if not self.server_config:
-            errors.append("服务器配置不能为空")
+            yield "服务器配置不能为空"
         else:
             # 验证服务器配置必需字段
-            required_fields = ['id', 'domain', 'protocol', 'port']
-            for field in required_fields:
-                if field not in self.server_config:
-                    errors.append(f"服务器配置缺少必需字段: {field}")
+            missing = _REQUIRED_SERVER_FIELDS.difference(self.server_config.keys())
+            if missing:
+                for field in _REQUIRED_SERVER_FIELD_ORDER:
+                    if field in missing:
+                        yield f"服务器配置缺少必需字段: {field}"
+    
+    def _matches_schema(self) -> bool:
+        """
+        使用预编译的 schema 快速检查配置
         
-        return errors
+        Returns:
+            是否通过（未安装 fastjsonschema 时恒为 False）
+        """
+        if _schema_validate is None:
+            return False
+        try:
+            _schema_validate(self.to_dict())
+            return True
+        except _SchemaError:
+            return False
+    
+    def validate(self) -> List[str]:
+        """
+        验证配置
+        
+        Returns:
+            错误信息列表
+        """
+        if self._matches_schema():
+            return []
+        return list(self._iter_errors())
     
     def is_valid(self) -> bool:
         """
@@ -170,4 +304,4 @@ class ClientConfig:
         Returns:
             是否有效
         """
-        return len(self.validate()) == 0
+        return self._matches_schema() or next(self._iter_errors(), None) is None
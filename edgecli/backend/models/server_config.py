@@ -3,8 +3,89 @@ Server Configuration Model
 服务端配置数据模型
 """
 
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+import json
+from typing import Dict, Any, Iterator, List, Optional
+from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False).encode('utf-8')
+    _loads = json.loads
+
+# XRay 服务端入站监听端口，同时也是分享给客户端的连接端口
+SERVER_INBOUND_PORT = 443
+
+# XRay 服务端配置模板，可变字段以占位符表示
+_XRAY_TEMPLATE: Dict[str, Any] = {
+    "log": {
+        "loglevel": "warning"
+    },
+    "inbounds": [
+        {
+            "port": SERVER_INBOUND_PORT,
+            "protocol": "vless",
+            "settings": {
+                "clients": [
+                    {
+                        "id": "__CLIENT_ID__",
+                        "flow": ""
+                    }
+                ],
+                "decryption": "none"
+            },
+            "streamSettings": {
+                "network": "xhttp",
+                "security": "tls",
+                "xhttpSettings": {
+                    "host": "__FRONTEND_HOST__",
+                    "mode": "auto",
+                    "path": "__PATH__",
+                    "scMaxBufferedPosts": 200,
+                    "scStreamUpServerSecs": "20-80"
+                },
+                "tlsSettings": {
+                    "serverName": "__FRONTEND_HOST__",
+                    "alpn": ["h3", "h2", "http/1.1"],
+                    "minVersion": "1.2",
+                    "certificates": [
+                        {
+                            "certificate": "__CERTIFICATE__",
+                            "key": "__PRIVATE_KEY__"
+                        }
+                    ]
+                }
+            }
+        }
+    ],
+    "outbounds": [
+        {
+            "protocol": "freedom",
+            "settings": {
+                "redirect": "__REDIRECT__"
+            }
+        }
+    ]
+}
+_XRAY_TEMPLATE_JSON = _dumps(_XRAY_TEMPLATE)
+
+# 字段检查（按报错顺序排列）：端口检查范围，其余字段检查非空
+_FIELD_CHECKS = (
+    ('name', "配置名称不能为空"),
+    ('frontend_host', "前端域名不能为空"),
+    ('backend_ip', "后端 IP 不能为空"),
+    ('backend_port', "后端端口必须在 1-65535 范围内"),
+    ('client_id', "客户端 ID 不能为空"),
+    ('certificate', "证书不能为空"),
+    ('private_key', "私钥不能为空"),
+)
 
 
 @dataclass
@@ -44,12 +125,21 @@ class ServerConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """
-        转换为字典
+        转换为字典（证书与私钥列表与实例共享，调用方不应修改）
         
         Returns:
             配置数据字典
         """
-        return asdict(self)
+        return {
+            'name': self.name,
+            'frontend_host': self.frontend_host,
+            'backend_ip': self.backend_ip,
+            'backend_port': self.backend_port,
+            'client_id': self.client_id,
+            'certificate': self.certificate,
+            'private_key': self.private_key,
+            'path': self.path
+        }
     
     def generate_xray_config(self) -> Dict[str, Any]:
         """
@@ -58,56 +148,18 @@ class ServerConfig:
         Returns:
             XRay 配置字典
         """
-        return {
-            "log": {
-                "loglevel": "warning"
-            },
-            "inbounds": [
-                {
-                    "port": 443,
-                    "protocol": "vless",
-                    "settings": {
-                        "clients": [
-                            {
-                                "id": self.client_id,
-                                "flow": ""
-                            }
-                        ],
-                        "decryption": "none"
-                    },
-                    "streamSettings": {
-                        "network": "xhttp",
-                        "security": "tls",
-                        "xhttpSettings": {
-                            "host": self.frontend_host,
-                            "mode": "auto",
-                            "path": self.path,
-                            "scMaxBufferedPosts": 200,
-                            "scStreamUpServerSecs": "20-80"
-                        },
-                        "tlsSettings": {
-                            "serverName": self.frontend_host,
-                            "alpn": ["h3", "h2", "http/1.1"],
-                            "minVersion": "1.2",
-                            "certificates": [
-                                {
-                                    "certificate": self.certificate,
-                                    "key": self.private_key
-                                }
-                            ]
-                        }
-                    }
-                }
-            ],
-            "outbounds": [
-                {
-                    "protocol": "freedom",
-                    "settings": {
-                        "redirect": f"{self.backend_ip}:{self.backend_port}"
-                    }
-                }
-            ]
-        }
+        # 占位符替换为 JSON 编码后的值，反序列化一次即得到全新的可变字典
+        data = _XRAY_TEMPLATE_JSON
+        for token, value in (
+            (b'"__CLIENT_ID__"', self.client_id),
+            (b'"__FRONTEND_HOST__"', self.frontend_host),
+            (b'"__PATH__"', self.path),
+            (b'"__CERTIFICATE__"', self.certificate),
+            (b'"__PRIVATE_KEY__"', self.private_key),
+            (b'"__REDIRECT__"', f"{self.backend_ip}:{self.backend_port}"),
+        ):
+            data = data.replace(token, _dumps(value))
+        return _loads(data)
     
     def get_connection_info(self) -> Dict[str, Any]:
         """
@@ -120,10 +172,24 @@ class ServerConfig:
             "id": self.client_id,
             "domain": self.frontend_host,
             "protocol": "vless",
-            "port": 443,
+            "port": SERVER_INBOUND_PORT,
             "path": self.path
         }
     
+    def _iter_errors(self) -> Iterator[str]:
+        """
+        逐条生成验证错误
+        
+        Yields:
+            错误信息
+        """
+        for attr, message in _FIELD_CHECKS:
+            if attr == 'backend_port':
+                if not (1 <= self.backend_port <= 65535):
+                    yield message
+            elif not getattr(self, attr):
+                yield message
+    
     def validate(self) -> List[str]:
         """
         验证配置
@@ -131,30 +197,7 @@ class ServerConfig:
         Returns:
             错误信息列表
         """
-        errors = []
-        
-        if not self.name:
-            errors.append("配置名称不能为空")
-        
-        if not self.frontend_host:
-            errors.append("前端域名不能为空")
-        
-        if not self.backend_ip:
-            errors.append("后端 IP 不能为空")
-        
-        if not (1 <= self.backend_port <= 65535):
-            errors.append("后端端口必须在 1-65535 范围内")
-        
-        if not self.client_id:
-            errors.append("客户端 ID 不能为空")
-        
-        if not self.certificate:
-            errors.append("证书不能为空")
-        
-        if not self.private_key:
-            errors.append("私钥不能为空")
-        
-        return errors
+        return list(self._iter_errors())
     
     def is_valid(self) -> bool:
         """
@@ -163,4 +206,4 @@ class ServerConfig:
         Returns:
             是否有效
         """
-        return len(self.validate()) == 0
+        return next(self._iter_errors(), None) is None
@@ -3,8 +3,24 @@ Backend Services Module
 后端服务模块
 """
 
-from .crypto_service import CryptoService
-from .dns_service import DNSService
-from .link_service import LinkService
+import importlib
+
+# 服务依赖 cryptography / dnspython，导入较慢，按需加载
+_LAZY_EXPORTS = {
+    'CryptoService': '.crypto_service',
+    'DNSService': '.dns_service',
+    'LinkService': '.link_service',
+}
+
+
+def __getattr__(name):
+    """首次访问时导入对应服务模块"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ['CryptoService', 'DNSService', 'LinkService']
@@ -3,18 +3,172 @@ Crypto Service
 加密服务 - 提供证书生成、UUID 生成等加密相关功能
 """
 
+import re
 import uuid
 import json
 import base64
 import secrets
-import string
-from datetime import datetime, timedelta
+import functools
+from datetime import date, datetime, timedelta, timezone
 from cryptography import x509
 from cryptography.x509.oid import NameOID
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
 from typing import Tuple, List, Dict, Any
 
+# edge:// 链接的前缀与 base64 字符集预检查
+_EDGE_LINK_RE = re.compile(r'edge://[A-Za-z0-9+/=]+')
+
+# 标准 base64 字符集与填充
+_BASE64_RE = re.compile(r'[A-Za-z0-9+/]*={0,2}')
+
+
+@functools.lru_cache(maxsize=128)
+def _generate_self_signed_cert_cached(domain: str, validity_days: int,
+                                      day_bucket: int, key_type: str = "ec") -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    生成自签名证书并按 (域名, 有效期, 日期) 缓存
+
+    Args:
+        domain: 域名
+        validity_days: 有效期天数
+        day_bucket: 当天的日期序数，跨天后重新生成，保证有效期从当天起算
+        key_type: 密钥类型，"ec"（P-256）或 "ed25519"
+
+    Returns:
+        (证书行元组, 私钥行元组)
+    """
+    # 生成私钥；Ed25519 自带哈希，签名时不指定摘要算法
+    if key_type == "ed25519":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+        sign_hash = None
+    elif key_type == "ec":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        sign_hash = hashes.SHA256()
+    else:
+        raise ValueError(f"不支持的密钥类型: {key_type}")
+    
+    # 创建证书主题
+    subject = issuer = x509.Name([
+        x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Xray Inc"),
+        x509.NameAttribute(NameOID.COMMON_NAME, "Xray Inc"),
+    ])
+    
+    # 创建证书（起止时间基于同一时间戳）
+    now = datetime.now(timezone.utc)
+    cert = x509.CertificateBuilder().subject_name(
+        subject
+    ).issuer_name(
+        issuer
+    ).public_key(
+        private_key.public_key()
+    ).serial_number(
+        x509.random_serial_number()
+    ).not_valid_before(
+        now
+    ).not_valid_after(
+        now + timedelta(days=validity_days)
+    ).add_extension(
+        x509.SubjectAlternativeName([
+            x509.DNSName(domain),
+        ]),
+        critical=False,
+    ).add_extension(
+        x509.KeyUsage(
+            digital_signature=True,
+            key_encipherment=key_type == "ec",  # Ed25519 仅用于签名
+            key_agreement=False,
+            key_cert_sign=True,
+            crl_sign=False,
+            content_commitment=False,
+            data_encipherment=False,
+            encipher_only=False,
+            decipher_only=False,
+        ),
+        critical=True,
+    ).add_extension(
+        x509.ExtendedKeyUsage([
+            x509.oid.ExtendedKeyUsageOID.SERVER_AUTH,
+        ]),
+        critical=True,
+    ).add_extension(
+        x509.BasicConstraints(ca=True, path_length=None),
+        critical=True,
+    ).sign(private_key, sign_hash)
+    
+    # 序列化证书
+    cert_pem = cert.public_bytes(serialization.Encoding.PEM)
+    cert_lines = cert_pem.decode('ascii').splitlines()
+    
+    # 序列化私钥
+    key_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+    key_lines = key_pem.decode('ascii').splitlines()
+    
+    return tuple(cert_lines), tuple(key_lines)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_edge_link_cached(edge_link: str) -> Dict[str, Any]:
+    """
+    解析 edge:// 链接并按链接缓存结果（调用方不应修改返回的字典）
+
+    Args:
+        edge_link: edge:// 链接
+
+    Returns:
+        配置数据字典
+
+    Raises:
+        ValueError: 链接格式无效
+    """
+    if not edge_link.startswith('edge://'):
+        raise ValueError("无效的 edge:// 链接格式")
+    
+    try:
+        # 提取 base64 部分
+        base64_part = edge_link[7:]  # 移除 'edge://'
+        
+        # 长度与字符集不合法时直接拒绝，无需解码
+        if len(base64_part) % 4 or not _BASE64_RE.fullmatch(base64_part):
+            raise ValueError("无效的 edge:// 链接格式: base64 编码无效")
+        
+        # 从 base64 解码
+        json_content = base64.b64decode(base64_part, validate=True).decode('utf-8')
+        
+        # 解析 JSON
+        config_data = json.loads(json_content)
+        
+        # 验证必需字段
+        required_fields = ['id', 'domain', 'protocol', 'port']
+        if not all(field in config_data for field in required_fields):
+            raise ValueError("edge:// 链接中缺少必需字段")
+        
+        return config_data
+        
+    except (base64.binascii.Error, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"无效的 edge:// 链接格式: {str(e)}")
+
+
+@functools.lru_cache(maxsize=32)
+def _validate_edge_link_cached(edge_link: str) -> bool:
+    """
+    按链接缓存校验结果，重复粘贴同一无效链接时无需再次解码
+    
+    Args:
+        edge_link: edge:// 链接
+        
+    Returns:
+        是否有效
+    """
+    try:
+        _parse_edge_link_cached(edge_link)
+        return True
+    except ValueError:
+        return False
 
 class CryptoService:
     """加密服务"""
@@ -37,90 +191,40 @@ class CryptoService:
         Returns:
             16位随机字符串
         """
-        # 使用字母和数字生成16位随机字符串
-        alphabet = string.ascii_letters + string.digits
-        return ''.join(secrets.choice(alphabet) for _ in range(16))
+        # 12 字节随机数经 URL 安全的 base64 编码恰好为 16 位（字母、数字、- 和 _）
+        return secrets.token_urlsafe(12)
     
     @staticmethod
-    def generate_self_signed_cert(domain: str, validity_days: int = 90) -> Tuple[List[str], List[str]]:
+    def generate_self_signed_cert(domain: str, validity_days: int = 90,
+                                  key_type: str = "ec") -> Tuple[List[str], List[str]]:
         """
         为指定域名生成自签名证书
         
+        同一天内对相同域名和有效期的重复调用会复用已生成的证书。
+        
         Args:
             domain: 域名
             validity_days: 有效期天数
+            key_type: 密钥类型，"ec"（P-256，默认）或 "ed25519"；
+                Ed25519 生成更快，但部分 CDN 回源时不接受 Ed25519 证书
             
         Returns:
             (证书行列表, 私钥行列表)
         """
-        # 生成私钥
-        private_key = ec.generate_private_key(ec.SECP256R1())
-        
-        # 创建证书主题
-        subject = issuer = x509.Name([
-            x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Xray Inc"),
-            x509.NameAttribute(NameOID.COMMON_NAME, "Xray Inc"),
-        ])
-        
-        # 创建证书
-        cert = x509.CertificateBuilder().subject_name(
-            subject
-        ).issuer_name(
-            issuer
-        ).public_key(
-            private_key.public_key()
-        ).serial_number(
-            x509.random_serial_number()
-        ).not_valid_before(
-            datetime.utcnow()
-        ).not_valid_after(
-            datetime.utcnow() + timedelta(days=validity_days)
-        ).add_extension(
-            x509.SubjectAlternativeName([
-                x509.DNSName(domain),
-            ]),
-            critical=False,
-        ).add_extension(
-            x509.KeyUsage(
-                digital_signature=True,
-                key_encipherment=True,
-                key_agreement=False,
-                key_cert_sign=True,
-                crl_sign=False,
-                content_commitment=False,
-                data_encipherment=False,
-                encipher_only=False,
-                decipher_only=False,
-            ),
-            critical=True,
-        ).add_extension(
-            x509.ExtendedKeyUsage([
-                x509.oid.ExtendedKeyUsageOID.SERVER_AUTH,
-            ]),
-            critical=True,
-        ).add_extension(
-            x509.BasicConstraints(ca=True, path_length=None),
-            critical=True,
-        ).sign(private_key, hashes.SHA256())
-        
-        # 序列化证书
-        cert_pem = cert.public_bytes(serialization.Encoding.PEM)
-        cert_lines = cert_pem.decode('utf-8').strip().split('\n')
-        
-        # 序列化私钥
-        key_pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption()
+        cert_lines, key_lines = _generate_self_signed_cert_cached(
+            domain, validity_days, date.today().toordinal(), key_type
         )
-        key_lines = key_pem.decode('utf-8').strip().split('\n')
-        
-        return cert_lines, key_lines
+        return list(cert_lines), list(key_lines)
     
     @staticmethod
-    def format_txt_record(client_id: str, domain: str, path: str, additional_info: Dict[str, Any] = None) -> str:
+    def clear_cert_cache() -> None:
+        """清空自签名证书缓存"""
+        _generate_self_signed_cert_cached.cache_clear()
+    
+    @staticmethod
+    def _record_json(client_id: str, domain: str, path: str, additional_info: Dict[str, Any] = None) -> str:
         """
-        格式化 DNS TXT 记录
+        构建分享用的紧凑 JSON 字符串
 
         Args:
             client_id: 客户端 ID
@@ -129,7 +233,7 @@ class CryptoService:
             additional_info: 额外信息
 
         Returns:
-            TXT 记录字符串
+            JSON 字符串
         """
         record_data = {
             "id": client_id,
@@ -142,9 +246,23 @@ class CryptoService:
         if additional_info:
             record_data.update(additional_info)
 
-        # 创建紧凑的 JSON 字符串
-        txt_content = json.dumps(record_data, separators=(',', ':'))
+        return json.dumps(record_data, separators=(',', ':'))
+    
+    @staticmethod
+    def format_txt_record(client_id: str, domain: str, path: str, additional_info: Dict[str, Any] = None) -> str:
+        """
+        格式化 DNS TXT 记录
 
+        Args:
+            client_id: 客户端 ID
+            domain: 域名
+            path: 路径
+            additional_info: 额外信息
+
+        Returns:
+            TXT 记录字符串
+        """
+        txt_content = CryptoService._record_json(client_id, domain, path, additional_info)
         return f"v=edgecli1; {txt_content}"
     
     @staticmethod
@@ -161,30 +279,39 @@ class CryptoService:
         Returns:
             edge:// 链接字符串
         """
-        record_data = {
-            "id": client_id,
-            "domain": domain,
-            "protocol": "vless",
-            "port": 443,
-            "path": path
-        }
-
-        if additional_info:
-            record_data.update(additional_info)
-
-        # 创建紧凑的 JSON 字符串
-        json_content = json.dumps(record_data, separators=(',', ':'))
+        json_content = CryptoService._record_json(client_id, domain, path, additional_info)
 
         # 编码为 base64
         base64_content = base64.b64encode(json_content.encode('utf-8')).decode('ascii')
 
         return f"edge://{base64_content}"
     
+    @staticmethod
+    def format_sharing_payloads(client_id: str, domain: str, path: str,
+                                additional_info: Dict[str, Any] = None) -> Tuple[str, str]:
+        """
+        同时生成 TXT 记录与 edge:// 链接，两者共用一次 JSON 序列化
+
+        Args:
+            client_id: 客户端 ID
+            domain: 域名
+            path: 路径
+            additional_info: 额外信息
+
+        Returns:
+            (TXT 记录字符串, edge:// 链接字符串)
+        """
+        json_content = CryptoService._record_json(client_id, domain, path, additional_info)
+        base64_content = base64.b64encode(json_content.encode('utf-8')).decode('ascii')
+        return f"v=edgecli1; {json_content}", f"edge://{base64_content}"
+    
     @staticmethod
     def parse_edge_link(edge_link: str) -> Dict[str, Any]:
         """
         解析 edge:// 链接并返回配置数据
         
+        解析结果按链接缓存，validate_edge_link 之后再解析同一链接不会重复解码。
+        
         Args:
             edge_link: edge:// 链接
             
@@ -194,28 +321,7 @@ class CryptoService:
         Raises:
             ValueError: 链接格式无效
         """
-        if not edge_link.startswith('edge://'):
-            raise ValueError("无效的 edge:// 链接格式")
-        
-        try:
-            # 提取 base64 部分
-            base64_part = edge_link[7:]  # 移除 'edge://'
-            
-            # 从 base64 解码
-            json_content = base64.b64decode(base64_part).decode('utf-8')
-            
-            # 解析 JSON
-            config_data = json.loads(json_content)
-            
-            # 验证必需字段
-            required_fields = ['id', 'domain', 'protocol', 'port']
-            if not all(field in config_data for field in required_fields):
-                raise ValueError("edge:// 链接中缺少必需字段")
-            
-            return config_data
-            
-        except (base64.binascii.Error, json.JSONDecodeError, UnicodeDecodeError) as e:
-            raise ValueError(f"无效的 edge:// 链接格式: {str(e)}")
+        return dict(_parse_edge_link_cached(edge_link))
     
     @staticmethod
     def validate_edge_link(edge_link: str) -> bool:
@@ -228,8 +334,8 @@ class CryptoService:
         Returns:
             是否有效
         """
-        try:
-            CryptoService.parse_edge_link(edge_link)
-            return True
-        except ValueError:
+        # 先做前缀与字符集的廉价检查，明显无效的链接无需解码
+        if not isinstance(edge_link, str) or not _EDGE_LINK_RE.fullmatch(edge_link):
             return False
+        
+        return _validate_edge_link_cached(edge_link)
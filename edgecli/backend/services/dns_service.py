@@ -3,14 +3,128 @@ DNS Service
 DNS 服务 - 提供 DNS TXT 记录查询和验证功能
 """
 
+import asyncio
+import dns.asyncresolver
 import dns.resolver
+import functools
 import json
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # 可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# EdgeCLI TXT 记录前缀
+_PREFIX = b'v=edgecli1;'
+_PREFIX_LEN = len(_PREFIX)
+
+# TXT 查询结果缓存：auth_domain -> (过期时间, 配置数据)
+# 只缓存查询成功的结果，避免用户刚添加记录后重试仍命中过期的失败结果
+_TXT_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_TXT_CACHE_LOCK = threading.Lock()
+_TXT_CACHE_MAXSIZE = 256
+_TXT_CACHE_MAX_TTL = 600
+# 记录 TTL 过短（含 0）时至少缓存 60 秒，同一会话内重复创建配置无需再次查询
+_TXT_CACHE_MIN_TTL = 60
+
+# 异步查询时与系统解析器并发竞速的公共 DNS，以及单个解析器的超时（秒）
+_RACE_NAMESERVERS = ('1.1.1.1', '8.8.8.8')
+_RACE_TIMEOUT = 2.0
+
+
+def _cache_get(auth_domain: str) -> Optional[Dict[str, Any]]:
+    """读取未过期的缓存结果"""
+    with _TXT_CACHE_LOCK:
+        entry = _TXT_CACHE.get(auth_domain)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _TXT_CACHE[auth_domain]
+            return None
+        return entry[1]
+
+
+def _cache_put(auth_domain: str, answers, config_data: Dict[str, Any]) -> None:
+    """按记录 TTL（60 ~ 600 秒）缓存查询结果"""
+    ttl = getattr(answers.rrset, 'ttl', 0)
+    ttl = max(_TXT_CACHE_MIN_TTL, min(ttl, _TXT_CACHE_MAX_TTL))
+    with _TXT_CACHE_LOCK:
+        if auth_domain not in _TXT_CACHE and len(_TXT_CACHE) >= _TXT_CACHE_MAXSIZE:
+            # 淘汰最早写入的条目
+            del _TXT_CACHE[next(iter(_TXT_CACHE))]
+        _TXT_CACHE[auth_domain] = (time.monotonic() + ttl, config_data)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_resolver() -> dns.resolver.Resolver:
+    """获取共享的同步解析器（首次使用时读取系统 DNS 配置）"""
+    return dns.resolver.Resolver(configure=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_async_resolver() -> dns.asyncresolver.Resolver:
+    """获取共享的异步解析器（首次使用时读取系统 DNS 配置）"""
+    return dns.asyncresolver.Resolver(configure=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_race_resolvers() -> Tuple[dns.asyncresolver.Resolver, ...]:
+    """获取参与竞速的异步解析器：系统解析器 + 各公共 DNS"""
+    resolvers = []
+    try:
+        resolvers.append(_get_async_resolver())
+    except Exception:
+        # 无系统 DNS 配置（如缺少 /etc/resolv.conf）时仅使用公共 DNS
+        pass
+    for nameserver in _RACE_NAMESERVERS:
+        resolver = dns.asyncresolver.Resolver(configure=False)
+        resolver.nameservers = [nameserver]
+        resolvers.append(resolver)
+    return tuple(resolvers)
 
 
 class DNSService:
     """DNS 服务"""
     
+    @staticmethod
+    def _parse_txt_answers(answers) -> Optional[Dict[str, Any]]:
+        """
+        从 TXT 查询结果中解析 EdgeCLI 配置
+        
+        Args:
+            answers: TXT 查询结果
+            
+        Returns:
+            配置数据字典或 None
+        """
+        for rdata in answers:
+            # 直接拼接原始字节，省去逐段解码
+            txt_content = b''.join(
+                part if isinstance(part, bytes) else str(part).encode('utf-8')
+                for part in rdata.strings
+            )
+            
+            # 检查是否为 EdgeCLI 记录
+            if txt_content.startswith(_PREFIX):
+                try:
+                    # 提取 JSON 部分（bytes 可直接反序列化）
+                    config_data = _loads(txt_content[_PREFIX_LEN:].lstrip())
+                    
+                    # 验证必需字段
+                    required_fields = ['id', 'domain', 'protocol', 'port']
+                    if all(field in config_data for field in required_fields):
+                        return config_data
+                    
+                except ValueError:
+                    continue
+        
+        return None
+    
     @staticmethod
     def query_txt_record(domain: str) -> Optional[Dict[str, Any]]:
         """
@@ -25,34 +139,99 @@ class DNSService:
         auth_domain = f"_auth.{domain}"
         
         try:
+            cached = _cache_get(auth_domain)
+            if cached is not None:
+                return dict(cached)
+            
             # 查询 TXT 记录
-            answers = dns.resolver.resolve(auth_domain, 'TXT')
+            answers = _get_resolver().resolve(auth_domain, 'TXT')
+            config_data = DNSService._parse_txt_answers(answers)
+            if config_data is not None:
+                _cache_put(auth_domain, answers, config_data)
+                return dict(config_data)
+            return None
             
-            for rdata in answers:
-                txt_content = ''.join([
-                    part.decode('utf-8') if isinstance(part, bytes) else str(part) 
-                    for part in rdata.strings
-                ])
-                
-                # 检查是否为 EdgeCLI 记录
-                if txt_content.startswith('v=edgecli1;'):
-                    try:
-                        # 提取 JSON 部分
-                        json_part = txt_content[11:].strip()  # 移除 'v=edgecli1; '
-                        config_data = json.loads(json_part)
-                        
-                        # 验证必需字段
-                        required_fields = ['id', 'domain', 'protocol', 'port']
-                        if all(field in config_data for field in required_fields):
-                            return config_data
-                        
-                    except json.JSONDecodeError:
-                        continue
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, Exception):
+            return None
+    
+    @staticmethod
+    async def _resolve_with(resolver: dns.asyncresolver.Resolver, auth_domain: str):
+        """
+        使用指定解析器查询并解析 TXT 记录
+        
+        Args:
+            resolver: 异步解析器
+            auth_domain: 查询域名
             
+        Returns:
+            (查询结果, 配置数据) 元组，未找到配置时配置数据为 None
+        """
+        answers = await resolver.resolve(auth_domain, 'TXT', lifetime=_RACE_TIMEOUT)
+        return answers, DNSService._parse_txt_answers(answers)
+    
+    @staticmethod
+    async def query_txt_record_async(domain: str) -> Optional[Dict[str, Any]]:
+        """
+        异步查询 _auth.<domain> 的 TXT 记录并解析 EdgeCLI 配置
+        
+        系统解析器与公共 DNS 并发查询，采用最先返回有效配置的结果，
+        每个解析器最多等待 _RACE_TIMEOUT 秒。
+        
+        Args:
+            domain: 域名
+            
+        Returns:
+            配置数据字典或 None
+        """
+        auth_domain = f"_auth.{domain}"
+        
+        cached = _cache_get(auth_domain)
+        if cached is not None:
+            return dict(cached)
+        
+        try:
+            return await DNSService._race_resolvers(auth_domain)
+        except Exception:
             return None
+    
+    @staticmethod
+    async def _race_resolvers(auth_domain: str) -> Optional[Dict[str, Any]]:
+        """
+        并发使用各解析器查询，返回最先得到的有效配置
+        
+        Args:
+            auth_domain: 查询域名
             
-        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, Exception):
+        Returns:
+            配置数据字典或 None
+        """
+        pending = {
+            asyncio.ensure_future(DNSService._resolve_with(resolver, auth_domain))
+            for resolver in _get_race_resolvers()
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    answers, config_data = task.result()
+                    if config_data is not None:
+                        _cache_put(auth_domain, answers, config_data)
+                        return dict(config_data)
             return None
+        finally:
+            # 取消仍在进行的较慢查询
+            for task in pending:
+                task.cancel()
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """清空 TXT 查询结果缓存"""
+        with _TXT_CACHE_LOCK:
+            _TXT_CACHE.clear()
     
     @staticmethod
     def validate_txt_record_format(txt_content: str) -> bool:
@@ -107,8 +107,9 @@ class LinkService:
         Returns:
             分享数据字典
         """
-        txt_record = self.generate_txt_record(client_id, domain, path)
-        edge_link = self.generate_edge_link(client_id, domain, path)
+        txt_record, edge_link = self.crypto_service.format_sharing_payloads(
+            client_id, domain, path
+        )
 
         return {
             "txt_record": txt_record,
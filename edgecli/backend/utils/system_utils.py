@@ -4,11 +4,64 @@ System Utils
 """
 
 import os
+import sys
+import functools
 import platform
 import json
 from pathlib import Path
 from typing import Dict, Any, Tuple
 
+try:
+    import orjson
+except ImportError:  # 可选依赖，缺失时回退到标准库 json
+    orjson = None
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_cached() -> Tuple[str, str]:
+    """
+    获取当前平台信息（进程内结果不变，只计算一次）
+    
+    Returns:
+        (平台名称, 架构)
+    """
+    system = platform.system().lower()
+    machine = platform.machine().lower()
+    
+    if system == "windows":
+        return "windows", "64" if machine in ["amd64", "x86_64"] else "32"
+    elif system == "darwin":
+        return "macos", "64"
+    elif system == "linux":
+        if machine in ["aarch64", "arm64"]:
+            return "linux", "arm64"
+        elif machine.startswith("arm"):
+            return "linux", "arm32"
+        else:
+            return "linux", "64" if machine in ["amd64", "x86_64"] else "32"
+    else:
+        raise ValueError(f"不支持的平台: {system}")
+
+
+@functools.lru_cache(maxsize=1)
+def _system_info_cached() -> Dict[str, Any]:
+    """
+    获取进程内不变的系统信息（platform.processor 在 Linux 上可能调用 uname）
+    
+    Returns:
+        系统信息字典
+    """
+    platform_name, arch = _platform_cached()
+    
+    return {
+        "platform": platform_name,
+        "architecture": arch,
+        "python_version": platform.python_version(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor()
+    }
+
 
 class SystemUtils:
     """系统工具类"""
@@ -21,22 +74,7 @@ class SystemUtils:
         Returns:
             (平台名称, 架构)
         """
-        system = platform.system().lower()
-        machine = platform.machine().lower()
-        
-        if system == "windows":
-            return "windows", "64" if machine in ["amd64", "x86_64"] else "32"
-        elif system == "darwin":
-            return "macos", "64"
-        elif system == "linux":
-            if machine in ["aarch64", "arm64"]:
-                return "linux", "arm64"
-            elif machine.startswith("arm"):
-                return "linux", "arm32"
-            else:
-                return "linux", "64" if machine in ["amd64", "x86_64"] else "32"
-        else:
-            raise ValueError(f"不支持的平台: {system}")
+        return _platform_cached()
     
     @staticmethod
     def setup_directories(directories: list = None) -> None:
@@ -68,6 +106,9 @@ class SystemUtils:
             ValueError: JSON 格式无效
         """
         try:
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(file_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except FileNotFoundError:
@@ -84,9 +125,14 @@ class SystemUtils:
             config: 配置数据字典
             file_path: 文件路径
         """
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # 文件路径不含目录时 parent 为当前目录，mkdir 不会出错
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+        # json.dump 会按片段多次调用 write()，先整体序列化再一次写入
+        path.write_text(json.dumps(config, indent=2, ensure_ascii=False), encoding='utf-8')
     
     @staticmethod
     def get_system_info() -> Dict[str, Any]:
@@ -96,17 +142,9 @@ class SystemUtils:
         Returns:
             系统信息字典
         """
-        platform_name, arch = SystemUtils.get_platform()
-        
-        return {
-            "platform": platform_name,
-            "architecture": arch,
-            "python_version": platform.python_version(),
-            "working_directory": os.getcwd(),
-            "system": platform.system(),
-            "machine": platform.machine(),
-            "processor": platform.processor()
-        }
+        info = dict(_system_info_cached())
+        info["working_directory"] = os.getcwd()
+        return info
     
     @staticmethod
     def check_file_permissions(file_path: str) -> Dict[str, bool]:
@@ -119,13 +157,21 @@ class SystemUtils:
         Returns:
             权限信息字典
         """
-        path = Path(file_path)
+        try:
+            os.stat(file_path)
+        except OSError:
+            return {
+                "exists": False,
+                "readable": False,
+                "writable": False,
+                "executable": False
+            }
         
         return {
-            "exists": path.exists(),
-            "readable": os.access(file_path, os.R_OK) if path.exists() else False,
-            "writable": os.access(file_path, os.W_OK) if path.exists() else False,
-            "executable": os.access(file_path, os.X_OK) if path.exists() else False
+            "exists": True,
+            "readable": os.access(file_path, os.R_OK),
+            "writable": os.access(file_path, os.W_OK),
+            "executable": os.access(file_path, os.X_OK)
         }
     
     @staticmethod
@@ -139,9 +185,10 @@ class SystemUtils:
         Returns:
             是否成功
         """
+        if sys.platform == "win32":
+            return True
         try:
-            if SystemUtils.get_platform()[0] != "windows":
-                os.chmod(file_path, 0o755)
+            os.chmod(file_path, 0o755)
             return True
-        except Exception:
+        except OSError:
             return False
@@ -4,178 +4,255 @@ Validation Utils
 """
 
 import re
+import string
+import uuid
 import ipaddress
-from typing import Union
+from typing import Optional, Tuple, Union
 
+# 域名允许的字符（ASCII 字母、数字、连字符和点）及长度限制
+_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '-.')
+_DOMAIN_MAX_LEN = 253
+_LABEL_MAX_LEN = 63
 
-class ValidationUtils:
-    """验证工具类"""
+# 预编译的校验正则，配合 fullmatch 使用（$ 会放过结尾的换行符）
+_NAME_RE = re.compile(r'[a-zA-Z0-9_-]+')
+
+# 路径中不允许出现的字符
+_ILLEGAL_PATH_CHARS = frozenset('<>:"|?*')
+
+# 区分缺失字段与值为 None 的字段
+_MISSING = object()
+
+# 文件名非法字符统一替换为下划线
+_FILENAME_TRANSLATE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
+def parse_ipv4(ip: str) -> Optional[Tuple[int, int, int, int]]:
+    """
+    解析点分十进制 IPv4 地址
     
-    @staticmethod
-    def validate_ip_address(ip: str) -> bool:
-        """
-        验证 IP 地址格式
+    Args:
+        ip: IP 地址字符串
         
-        Args:
-            ip: IP 地址字符串
-            
-        Returns:
-            是否有效
-        """
-        try:
-            ipaddress.ip_address(ip)
-            return True
-        except ValueError:
-            return False
+    Returns:
+        四个八位组组成的元组，无效时为 None
+    """
+    parts = ip.split('.')
+    if len(parts) != 4:
+        return None
     
-    @staticmethod
-    def validate_domain(domain: str) -> bool:
-        """
-        验证域名格式
-        
-        Args:
-            domain: 域名字符串
-            
-        Returns:
-            是否有效
-        """
-        pattern = r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$'
-        return bool(re.match(pattern, domain))
-    
-    @staticmethod
-    def validate_port(port: Union[str, int]) -> bool:
-        """
-        验证端口号
-        
-        Args:
-            port: 端口号（字符串或整数）
-            
-        Returns:
-            是否有效
-        """
-        try:
-            port_num = int(port)
-            return 1 <= port_num <= 65535
-        except (ValueError, TypeError):
-            return False
+    octets = []
+    for part in parts:
+        # 与 ipaddress 一致：仅 ASCII 数字，不允许前导零
+        if not (0 < len(part) <= 3 and part.isascii() and part.isdigit()):
+            return None
+        if len(part) > 1 and part[0] == '0':
+            return None
+        value = int(part)
+        if value > 255:
+            return None
+        octets.append(value)
+    return tuple(octets)
+
+
+def validate_ip_address(ip: str) -> bool:
+    """
+    验证 IP 地址格式
     
-    @staticmethod
-    def validate_uuid(uuid_str: str) -> bool:
-        """
-        验证 UUID 格式
+    Args:
+        ip: IP 地址字符串
         
-        Args:
-            uuid_str: UUID 字符串
-            
-        Returns:
-            是否有效
-        """
-        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        return bool(re.match(uuid_pattern, uuid_str.lower()))
-    
-    @staticmethod
-    def validate_config_name(name: str) -> bool:
-        """
-        验证配置名称
-        
-        Args:
-            name: 配置名称
-            
-        Returns:
-            是否有效
-        """
-        if not name or not name.strip():
-            return False
-        
-        # 配置名称只能包含字母、数字、下划线和连字符
-        pattern = r'^[a-zA-Z0-9_-]+$'
-        return bool(re.match(pattern, name.strip()))
-    
-    @staticmethod
-    def validate_path(path: str) -> bool:
-        """
-        验证路径格式
+    Returns:
+        是否有效
+    """
+    # IPv4 直接扫描，只有含冒号（IPv6）或非字符串时才交给 ipaddress
+    if isinstance(ip, str) and ':' not in ip:
+        return parse_ipv4(ip) is not None
+    
+    try:
+        ipaddress.ip_address(ip)
+        return True
+    except ValueError:
+        return False
+
+
+def validate_domain(domain: str) -> bool:
+    """
+    验证域名格式
+    
+    Args:
+        domain: 域名字符串
         
-        Args:
-            path: 路径字符串
-            
-        Returns:
-            是否有效
-        """
-        if not path:
+    Returns:
+        是否有效
+    """
+    # 线性扫描：先整体检查字符集，再逐个检查标签长度和首尾连字符
+    if not domain or len(domain) > _DOMAIN_MAX_LEN or not _DOMAIN_CHARS.issuperset(domain):
+        return False
+    
+    for label in domain.split('.'):
+        if not 0 < len(label) <= _LABEL_MAX_LEN:
             return False
-        
-        # 路径应该以 / 开头
-        if not path.startswith('/'):
+        if label[0] == '-' or label[-1] == '-':
             return False
+    return True
+
+
+def parse_port(port: Union[str, int]) -> Optional[int]:
+    """
+    解析端口号
+    
+    Args:
+        port: 端口号（字符串或整数）
         
-        # 检查是否包含非法字符
-        illegal_chars = ['<', '>', ':', '"', '|', '?', '*']
-        return not any(char in path for char in illegal_chars)
-    
-    @staticmethod
-    def validate_protocol(protocol: str) -> bool:
-        """
-        验证协议名称
-        
-        Args:
-            protocol: 协议名称
-            
-        Returns:
-            是否有效
-        """
-        valid_protocols = ['vless', 'vmess', 'trojan', 'shadowsocks']
-        return protocol.lower() in valid_protocols
-    
-    @staticmethod
-    def sanitize_filename(filename: str) -> str:
-        """
-        清理文件名，移除非法字符
-        
-        Args:
-            filename: 原始文件名
-            
-        Returns:
-            清理后的文件名
-        """
-        # 移除或替换非法字符
-        illegal_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        sanitized = filename
-        
-        for char in illegal_chars:
-            sanitized = sanitized.replace(char, '_')
+    Returns:
+        端口号，无效时为 None
+    """
+    if isinstance(port, str):
+        # 字符串直接按 ASCII 数字判断，不经过 int() 的异常路径
+        port = port.strip()
+        if not (0 < len(port) <= 5 and port.isascii() and port.isdigit()):
+            return None
+        port_num = int(port)
+    else:
+        try:
+            port_num = int(port)
+        except (ValueError, TypeError):
+            return None
+    
+    return port_num if 1 <= port_num <= 65535 else None
+
+
+def validate_port(port: Union[str, int]) -> bool:
+    """
+    验证端口号
+    
+    Args:
+        port: 端口号（字符串或整数）
         
-        # 移除前后空格和点
-        sanitized = sanitized.strip(' .')
+    Returns:
+        是否有效
+    """
+    return parse_port(port) is not None
+
+
+def validate_uuid(uuid_str: str) -> bool:
+    """
+    验证 UUID 格式
+    
+    Args:
+        uuid_str: UUID 字符串
         
-        # 确保不为空
-        if not sanitized:
-            sanitized = "unnamed"
+    Returns:
+        是否有效
+    """
+    # 仅接受标准的带连字符形式；uuid.UUID 还会接受花括号、urn 前缀、
+    # 无连字符等写法，因此再与其规范化输出比对
+    if not isinstance(uuid_str, str) or len(uuid_str) != 36:
+        return False
+    try:
+        return str(uuid.UUID(uuid_str)) == uuid_str.lower()
+    except ValueError:
+        return False
+
+
+def validate_config_name(name: str) -> bool:
+    """
+    验证配置名称
+    
+    Args:
+        name: 配置名称
         
-        return sanitized
+    Returns:
+        是否有效
+    """
+    if not name or not name.strip():
+        return False
     
-    @staticmethod
-    def validate_json_structure(data: dict, required_fields: list) -> tuple[bool, list]:
-        """
-        验证 JSON 数据结构
+    # 配置名称只能包含字母、数字、下划线和连字符
+    return bool(_NAME_RE.fullmatch(name.strip()))
+
+
+def validate_path(path: str) -> bool:
+    """
+    验证路径格式
+    
+    Args:
+        path: 路径字符串
         
-        Args:
-            data: 要验证的数据字典
-            required_fields: 必需字段列表
-            
-        Returns:
-            (是否有效, 错误信息列表)
-        """
-        errors = []
+    Returns:
+        是否有效
+    """
+    # 路径应该以 / 开头，且不包含非法字符
+    return bool(path) and path.startswith('/') and _ILLEGAL_PATH_CHARS.isdisjoint(path)
+
+
+def validate_protocol(protocol: str) -> bool:
+    """
+    验证协议名称
+    
+    Args:
+        protocol: 协议名称
         
-        if not isinstance(data, dict):
-            errors.append("数据必须是字典格式")
-            return False, errors
+    Returns:
+        是否有效
+    """
+    valid_protocols = ['vless', 'vmess', 'trojan', 'shadowsocks']
+    return protocol.lower() in valid_protocols
+
+
+def sanitize_filename(filename: str) -> str:
+    """
+    清理文件名，移除非法字符
+    
+    Args:
+        filename: 原始文件名
         
-        for field in required_fields:
-            if field not in data:
-                errors.append(f"缺少必需字段: {field}")
-            elif data[field] is None or data[field] == "":
-                errors.append(f"字段 {field} 不能为空")
+    Returns:
+        清理后的文件名
+    """
+    # 替换非法字符并移除前后空格和点，确保不为空
+    return filename.translate(_FILENAME_TRANSLATE).strip(' .') or "unnamed"
+
+
+def validate_json_structure(data: dict, required_fields: list) -> tuple[bool, list]:
+    """
+    验证 JSON 数据结构
+    
+    Args:
+        data: 要验证的数据字典
+        required_fields: 必需字段列表
         
-        return len(errors) == 0, errors
+    Returns:
+        (是否有效, 错误信息列表)
+    """
+    errors = []
+    
+    if not isinstance(data, dict):
+        errors.append("数据必须是字典格式")
+        return False, errors
+    
+    for field in required_fields:
+        value = data.get(field, _MISSING)
+        if value is _MISSING:
+            errors.append(f"缺少必需字段: {field}")
+        elif value is None or value == "":
+            errors.append(f"字段 {field} 不能为空")
+    
+    return len(errors) == 0, errors
+
+
+class ValidationUtils:
+    """验证工具类，保留原有的静态方法接口，实际调用模块级函数"""
+    
+    parse_ipv4 = staticmethod(parse_ipv4)
+    validate_ip_address = staticmethod(validate_ip_address)
+    validate_domain = staticmethod(validate_domain)
+    parse_port = staticmethod(parse_port)
+    validate_port = staticmethod(validate_port)
+    validate_uuid = staticmethod(validate_uuid)
+    validate_config_name = staticmethod(validate_config_name)
+    validate_path = staticmethod(validate_path)
+    validate_protocol = staticmethod(validate_protocol)
+    sanitize_filename = staticmethod(sanitize_filename)
+    validate_json_structure = staticmethod(validate_json_structure)
@@ -3,20 +3,18 @@ Client CLI
 客户端命令行界面 - 客户端模式的用户界面
 """
 
+import asyncio
 import signal
 import sys
-from rich.console import Console
 from typing import Optional, Dict, Any
 
+from ..ui.console import STATUS_REFRESH_PER_SECOND, console
 from ..ui.display import Display
-from ..ui.menu import Menu
+from ..ui.menu import get_menu
 from ..utils.clipboard_utils import ClipboardUtils
+from ..utils.signal_utils import StopWaiter
 from ...backend.core.proxy_manager import ProxyManager
 from ...backend.models.client_config import ClientConfig
-from ...backend.services.crypto_service import CryptoService
-from ...backend.services.dns_service import DNSService
-
-console = Console()
 
 
 class ClientCLI:
@@ -31,13 +29,32 @@ class ClientCLI:
         """
         self.proxy_manager = proxy_manager
         self.display = Display()
-        self.menu = Menu()
+        self.menu = get_menu()
         self.clipboard_utils = ClipboardUtils()
-        self.crypto_service = CryptoService()
-        self.dns_service = DNSService()
+        self._crypto_service = None
+        self._dns_service = None
         
         self.current_config = None
         self.current_config_name = None
+        
+        # XRay 退出或收到关闭信号时置位
+        self._stop_waiter = StopWaiter()
+    
+    @property
+    def crypto_service(self):
+        """加密服务，首次使用时才导入"""
+        if self._crypto_service is None:
+            from ...backend.services.crypto_service import CryptoService
+            self._crypto_service = CryptoService()
+        return self._crypto_service
+    
+    @property
+    def dns_service(self):
+        """DNS 服务，首次使用时才导入"""
+        if self._dns_service is None:
+            from ...backend.services.dns_service import DNSService
+            self._dns_service = DNSService()
+        return self._dns_service
     
     def run(self, config_path: Optional[str] = None):
         """
@@ -104,8 +121,11 @@ class ClientCLI:
         # 查询 DNS TXT 记录
         console.print(f"\n[cyan]🔍 正在查询 {config_data['remote_domain']} 的服务器配置信息...[/cyan]")
         
-        with console.status("[cyan]查询中...", spinner="dots"):
-            server_config = self.dns_service.query_txt_record(config_data['remote_domain'])
+        with console.status("[cyan]查询中...", spinner="dots",
+                            refresh_per_second=STATUS_REFRESH_PER_SECOND):
+            server_config = asyncio.run(
+                self.dns_service.query_txt_record_async(config_data['remote_domain'])
+            )
         
         if not server_config:
             console.print(f"[red]❌ 无法从 DNS 获取服务器配置信息[/red]")
@@ -166,7 +186,8 @@ class ClientCLI:
         console.print(f"\n[cyan]🔍 正在解析 Edge 链接...[/cyan]")
         
         try:
-            with console.status("[cyan]解析中...", spinner="dots"):
+            with console.status("[cyan]解析中...", spinner="dots",
+                                refresh_per_second=STATUS_REFRESH_PER_SECOND):
                 server_config = self.crypto_service.parse_edge_link(config_data['edge_link'])
             
             console.print(f"[green]✅ 成功解析配置信息！[/green]")
@@ -205,7 +226,7 @@ class ClientCLI:
             console.print(f"[cyan]💡 您的 Minecraft 客户端连接地址: {client_config.get_local_address()}[/cyan]")
             
             # 复制本地地址到剪贴板
-            self.clipboard_utils.copy_with_simple_feedback(
+            self.clipboard_utils.copy_async(
                 client_config.get_local_address(), 
                 "本地代理地址"
             )
@@ -219,14 +240,16 @@ class ClientCLI:
     def _start_client(self):
         """启动客户端"""
         # 启动 XRay
-        if self.proxy_manager.start_client(self.current_config, self.current_config_name):
+        self._stop_waiter.clear()
+        if self.proxy_manager.start_client(self.current_config, self.current_config_name,
+                                          self._stop_waiter.set):
             # 显示连接信息
             local_address = self.current_config.get_local_address()
             console.print(f"\n[green]✅ 客户端启动成功！[/green]")
             console.print(f"[cyan]🎮 Minecraft 连接地址: {local_address}[/cyan]")
             
             # 复制本地地址到剪贴板
-            self.clipboard_utils.copy_with_simple_feedback(local_address, "本地代理地址")
+            self.clipboard_utils.copy_async(local_address, "本地代理地址")
             
             # 设置信号处理
             signal.signal(signal.SIGINT, self._signal_handler)
@@ -237,9 +260,7 @@ class ClientCLI:
             console.print("[yellow]按 Ctrl+C 停止服务[/yellow]")
             
             try:
-                while self.proxy_manager.is_running():
-                    import time
-                    time.sleep(1)
+                self._stop_waiter.wait()
             except KeyboardInterrupt:
                 pass
         else:
@@ -248,5 +269,7 @@ class ClientCLI:
     def _signal_handler(self, signum, frame):
         """处理关闭信号"""
         console.print("\n[yellow]正在停止客户端...[/yellow]")
+        self._stop_waiter.set()
         self.proxy_manager.stop_proxy()
+        self.clipboard_utils.wait_for_pending()
         sys.exit(0)
@@ -4,18 +4,16 @@ Main CLI
 """
 
 import sys
-from rich.console import Console
 from typing import Optional
 
+from ..ui.console import STATUS_REFRESH_PER_SECOND, console
 from ..ui.display import Display
-from ..ui.menu import Menu
+from ..ui.menu import get_menu
 from .server_cli import ServerCLI
 from .client_cli import ClientCLI
 from ...backend.core.proxy_manager import ProxyManager
 from ...backend.utils.system_utils import SystemUtils
 
-console = Console()
-
 
 class MainCLI:
     """主命令行界面"""
@@ -23,10 +21,14 @@ class MainCLI:
     def __init__(self):
         """初始化主 CLI"""
         self.display = Display()
-        self.menu = Menu()
+        self.menu = get_menu()
         self.proxy_manager = ProxyManager()
         self.system_utils = SystemUtils()
         
+        # XRay 二进制检查结果及对应的文件 mtime，文件未变化时复用
+        self._xray_ok = None
+        self._xray_mtime = None
+        
         # 初始化子 CLI
         self.server_cli = ServerCLI(self.proxy_manager)
         self.client_cli = ClientCLI(self.proxy_manager)
@@ -66,8 +68,7 @@ class MainCLI:
         """运行主菜单循环"""
         while True:
             try:
-                console.clear()
-                self.display.show_banner()
+                self._redraw_banner()
                 
                 # 检查 XRay 二进制文件
                 if not self._check_xray_binary():
@@ -76,6 +77,8 @@ class MainCLI:
                         sys.exit(1)
                 
                 # 显示主菜单并获取选择
+                # 输入在主线程同步读取：子菜单和向导也直接读取 stdin，后台读取线程会与之争抢输入；
+                # 回到主菜单时 XRay 已停止，没有需要在等待输入期间刷新的后台状态
                 choice = self.menu.show_main_menu()
                 
                 if choice == "0":
@@ -106,6 +109,12 @@ class MainCLI:
                 else:
                     break
     
+    def _redraw_banner(self):
+        """清屏并绘制横幅，两者合并为一次终端写入，避免闪烁"""
+        with console:
+            console.clear()
+            self.display.show_banner()
+    
     def _check_xray_binary(self) -> bool:
         """
         检查并下载 XRay 二进制文件
@@ -113,10 +122,11 @@ class MainCLI:
         Returns:
             是否准备就绪
         """
-        if not self.proxy_manager.xray_manager.check_xray_binary():
+        if not self._xray_binary_ready():
             console.print("[yellow]📥 XRay 核心文件未找到，正在下载...[/yellow]")
             
-            with console.status("[cyan]正在下载 XRay 核心文件...", spinner="dots"):
+            with console.status("[cyan]正在下载 XRay 核心文件...", spinner="dots",
+                                refresh_per_second=STATUS_REFRESH_PER_SECOND):
                 if not self.proxy_manager.xray_manager.download_xray():
                     console.print("[red]❌ XRay 核心文件下载失败！[/red]")
                     console.print("[yellow]💡 请检查网络连接或手动下载 XRay 到 bin 目录[/yellow]")
@@ -128,11 +138,30 @@ class MainCLI:
         
         return True
     
+    def _xray_binary_ready(self) -> bool:
+        """
+        检查 XRay 二进制文件，文件 mtime 未变化时复用上次结果
+        
+        Returns:
+            是否存在且可执行
+        """
+        xray_manager = self.proxy_manager.xray_manager
+        try:
+            mtime = xray_manager.xray_binary.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if self._xray_ok is not None and mtime == self._xray_mtime:
+            return self._xray_ok
+        
+        self._xray_ok = xray_manager.check_xray_binary()
+        self._xray_mtime = mtime
+        return self._xray_ok
+    
     def _handle_settings(self):
         """处理设置菜单"""
         while True:
-            console.clear()
-            self.display.show_banner()
+            self._redraw_banner()
             
             choice = self.menu.show_settings_menu()
             
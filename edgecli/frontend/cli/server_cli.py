@@ -5,18 +5,19 @@ Server CLI
 
 import signal
 import sys
-from rich.console import Console
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 
+from ..ui.console import console
 from ..ui.display import Display
-from ..ui.menu import Menu
+from ..ui.menu import get_menu
 from ..utils.clipboard_utils import ClipboardUtils
+from ..utils.signal_utils import StopWaiter
 from ...backend.core.proxy_manager import ProxyManager
 from ...backend.models.server_config import ServerConfig
-from ...backend.services.crypto_service import CryptoService
-from ...backend.services.link_service import LinkService
 
-console = Console()
+# 后台生成证书等凭据，与用户确认输入并行（线程在首次提交时才创建）
+_CREDENTIAL_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="edgecli-cred")
 
 
 class ServerCLI:
@@ -31,13 +32,32 @@ class ServerCLI:
         """
         self.proxy_manager = proxy_manager
         self.display = Display()
-        self.menu = Menu()
+        self.menu = get_menu()
         self.clipboard_utils = ClipboardUtils()
-        self.crypto_service = CryptoService()
-        self.link_service = LinkService()
+        self._crypto_service = None
+        self._link_service = None
         
         self.current_config = None
         self.current_config_name = None
+        
+        # XRay 退出或收到关闭信号时置位
+        self._stop_waiter = StopWaiter()
+    
+    @property
+    def crypto_service(self):
+        """加密服务，首次使用时才导入"""
+        if self._crypto_service is None:
+            from ...backend.services.crypto_service import CryptoService
+            self._crypto_service = CryptoService()
+        return self._crypto_service
+    
+    @property
+    def link_service(self):
+        """链接分享服务，首次使用时才导入"""
+        if self._link_service is None:
+            from ...backend.services.link_service import LinkService
+            self._link_service = LinkService()
+        return self._link_service
     
     def run(self):
         """运行服务端模式"""
@@ -88,8 +108,21 @@ class ServerCLI:
         if not config_data:
             return None, None
         
-        # 确认创建
-        if not self.menu.confirm_config_creation(config_data):
+        # 证书生成较慢，在用户确认期间提前于后台进行
+        cert_future = _CREDENTIAL_POOL.submit(
+            self.crypto_service.generate_self_signed_cert,
+            config_data["frontend_host"],
+            key_type=config_data["key_type"]
+        )
+        
+        # 确认创建；拒绝或中断时取消尚未开始的证书任务
+        try:
+            confirmed = self.menu.confirm_config_creation(config_data)
+        except BaseException:
+            cert_future.cancel()
+            raise
+        if not confirmed:
+            cert_future.cancel()
             console.print("[yellow]⚠️  配置创建已取消[/yellow]")
             return None, None
         
@@ -97,7 +130,7 @@ class ServerCLI:
         console.print("\n[cyan]🔐 正在生成安全凭据...[/cyan]")
         client_id = self.crypto_service.generate_uuid()
         random_path = f"/{self.crypto_service.generate_random_path()}"
-        cert_lines, key_lines = self.crypto_service.generate_self_signed_cert(config_data["frontend_host"])
+        cert_lines, key_lines = cert_future.result()
 
         # 创建配置对象
         server_config = ServerConfig(
@@ -123,7 +156,9 @@ class ServerCLI:
     def _start_server(self):
         """启动服务端"""
         # 启动 XRay
-        if self.proxy_manager.start_server(self.current_config, self.current_config_name):
+        self._stop_waiter.clear()
+        if self.proxy_manager.start_server(self.current_config, self.current_config_name,
+                                          self._stop_waiter.set):
             # 显示配置分享选项
             self._display_sharing_options()
             
@@ -136,9 +171,7 @@ class ServerCLI:
             console.print("[yellow]按 Ctrl+C 停止服务[/yellow]")
             
             try:
-                while self.proxy_manager.is_running():
-                    import time
-                    time.sleep(1)
+                self._stop_waiter.wait()
             except KeyboardInterrupt:
                 pass
         else:
@@ -153,54 +186,59 @@ class ServerCLI:
         elif choice == "2":
             self._display_edge_link()
         elif choice == "3":
-            console.print("\n[bold yellow]📋 DNS TXT 记录方式:[/bold yellow]")
-            self._display_txt_record()
+            sharing_data = self._get_sharing_data()
             
-            console.print("\n" + "="*80)
-            console.print("\n[bold yellow]🔗 Edge 链接方式:[/bold yellow]")
-            self._display_edge_link()
+            # 两种方式合并为一次输出
+            self.display.show_all_sharing_instructions(
+                sharing_data["dns_record_info"],
+                sharing_data["edge_link"]
+            )
+            
+            # 剪贴板只能保留一项，复制 Edge 链接
+            self.clipboard_utils.copy_async(
+                sharing_data["edge_link"],
+                "Edge 链接"
+            )
     
-    def _display_txt_record(self):
-        """显示 DNS 配置说明和 TXT 记录"""
+    def _get_sharing_data(self) -> Dict[str, Any]:
+        """
+        获取当前配置的分享数据
+        
+        Returns:
+            分享数据字典
+        """
         connection_info = self.current_config.get_connection_info()
-
-        # 获取分享数据
-        sharing_data = self.link_service.get_sharing_data(
+        return self.link_service.get_sharing_data(
             connection_info["id"],
             connection_info["domain"],
             connection_info["path"]
         )
+    
+    def _display_txt_record(self):
+        """显示 DNS 配置说明和 TXT 记录"""
+        sharing_data = self._get_sharing_data()
 
         # 显示说明
         self.display.show_dns_instructions(sharing_data["dns_record_info"])
 
         # 复制 TXT 记录到剪贴板
-        self.clipboard_utils.copy_with_simple_feedback(
+        self.clipboard_utils.copy_async(
             sharing_data["txt_record"],
             "DNS TXT 记录值"
         )
 
         # 显示主机记录名称
-        host_record = sharing_data["dns_record_info"]["host_record"]
-        console.print(f"\n[dim]💡 主机记录名称: {host_record}[/dim]")
-        console.print("[dim]（如需复制主机记录名称，请手动选择复制）[/dim]")
+        self.display.show_host_record_hint(sharing_data["dns_record_info"]["host_record"])
     
     def _display_edge_link(self):
         """显示 Edge 链接配置"""
-        connection_info = self.current_config.get_connection_info()
-
-        # 获取分享数据
-        sharing_data = self.link_service.get_sharing_data(
-            connection_info["id"],
-            connection_info["domain"],
-            connection_info["path"]
-        )
+        sharing_data = self._get_sharing_data()
 
         # 显示说明
         self.display.show_edge_link_instructions(sharing_data["edge_link"])
 
         # 复制 Edge 链接到剪贴板
-        self.clipboard_utils.copy_with_simple_feedback(
+        self.clipboard_utils.copy_async(
             sharing_data["edge_link"],
             "Edge 链接"
         )
@@ -208,5 +246,7 @@ class ServerCLI:
     def _signal_handler(self, signum, frame):
         """处理关闭信号"""
         console.print("\n[yellow]正在停止服务端...[/yellow]")
+        self._stop_waiter.set()
         self.proxy_manager.stop_proxy()
+        self.clipboard_utils.wait_for_pending()
         sys.exit(0)
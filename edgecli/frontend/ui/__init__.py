@@ -3,8 +3,9 @@ Frontend UI Module
 前端用户界面组件模块
 """
 
+from .console import console
 from .display import Display
-from .input_handler import InputHandler
-from .menu import Menu
+from .input_handler import FieldSpec, InputHandler
+from .menu import Menu, get_menu
 
-__all__ = ['Display', 'InputHandler', 'Menu']
+__all__ = ['console', 'Display', 'FieldSpec', 'InputHandler', 'Menu', 'get_menu']
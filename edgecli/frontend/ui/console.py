@@ -0,0 +1,12 @@
+"""
+Shared Console
+共享控制台 - 整个前端共用同一个 Rich Console，终端能力只探测一次
+"""
+
+from rich.console import Console
+
+# 所有输出都使用显式 markup 着色，关闭自动高亮以省去每次打印的正则扫描
+console = Console(highlight=False)
+
+# 等待状态 spinner 的刷新频率，低于 Rich 默认的 12.5 Hz 以减少重绘
+STATUS_REFRESH_PER_SECOND = 4
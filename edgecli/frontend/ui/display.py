@@ -3,14 +3,238 @@ Display Components
 显示组件 - 提供各种 UI 显示功能
 """
 
-from rich.console import Console
+import functools
 from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
 from rich.align import Align
-from typing import Dict, Any, List
+from rich.console import Group
+from typing import Dict, Any, List, Tuple
+from .console import console
 
-console = Console()
+
+# 配置摘要中单个值的最大显示长度
+_SUMMARY_MAX_LEN = 50
+
+
+def _truncate(value: str) -> str:
+    """超出摘要长度的值截断并以省略号结尾"""
+    if len(value) <= _SUMMARY_MAX_LEN:
+        return value
+    return value[:_SUMMARY_MAX_LEN - 3] + "..."
+
+
+def _build_banner() -> Align:
+    """构建欢迎横幅"""
+    banner_text = Text()
+    banner_text.append("EdgeCLI", style="bold bright_blue")
+    banner_text.append(" - Minecraft 代理工具", style="bright_white")
+
+    subtitle = Text("基于 XRay 的高性能代理解决方案", style="dim cyan")
+
+    banner_content = Align.center(banner_text + "\n" + subtitle)
+
+    banner_panel = Panel(
+        banner_content,
+        border_style="bright_blue",
+        padding=(1, 2),
+        width=80
+    )
+    return Align.center(banner_panel)
+
+
+def _build_options_panel(rows: Tuple[Tuple[str, str], ...], title: str,
+                         border_style: str) -> Align:
+    """
+    构建选项菜单面板
+    
+    Args:
+        rows: (选项, 说明) 行
+        title: 面板标题
+        border_style: 边框样式
+        
+    Returns:
+        居中的菜单面板
+    """
+    options_table = Table(show_header=False, box=None, padding=(0, 2))
+    options_table.add_column("选项", style="bold cyan", width=8)
+    options_table.add_column("说明", style="white")
+
+    for key, description in rows:
+        options_table.add_row(key, description)
+
+    options_panel = Panel(
+        options_table,
+        title=title,
+        border_style=border_style,
+        padding=(1, 1),
+        width=80
+    )
+    return Align.center(options_panel)
+
+
+def _build_main_menu() -> Align:
+    """构建主菜单"""
+    return _build_options_panel((
+        ("1", "🖥️  服务端模式 - 创建 Minecraft 代理服务器"),
+        ("2", "💻 客户端模式 - 连接到代理服务器"),
+        ("3", "⚙️  工具设置"),
+        ("0", "❌ 退出程序"),
+    ), "[bold green]主菜单[/bold green]", "green")
+
+
+def _build_settings_menu() -> Align:
+    """构建设置菜单"""
+    return _build_options_panel((
+        ("1", "📁 查看配置文件"),
+        ("2", "🗑️  删除配置文件"),
+        ("3", "📊 系统信息"),
+        ("0", "🔙 返回主菜单"),
+    ), "[bold yellow]工具设置[/bold yellow]", "yellow")
+
+
+def _build_sharing_options() -> Align:
+    """构建配置分享选项菜单"""
+    return _build_options_panel((
+        ("1", "🌐 DNS TXT 记录 - 通过域名自动获取配置"),
+        ("2", "🔗 Edge 链接 - 直接分享配置链接"),
+        ("3", "📋 显示所有方式"),
+    ), "[bold green]分享方式[/bold green]", "green")
+
+
+# 静态界面元素内容固定，导入时构建一次，之后直接打印
+_BANNER = _build_banner()
+_MAIN_MENU = _build_main_menu()
+_SETTINGS_MENU = _build_settings_menu()
+_SHARING_OPTIONS = _build_sharing_options()
+
+
+@functools.lru_cache(maxsize=16)
+def _build_config_list(configs: Tuple[str, ...], config_type: str) -> Align:
+    """
+    构建配置列表面板
+    
+    Args:
+        configs: 配置名称
+        config_type: 配置类型
+        
+    Returns:
+        居中的配置列表面板
+    """
+    config_table = Table(show_header=True, header_style="bold magenta", width=70)
+    config_table.add_column("序号", style="dim", width=6)
+    config_table.add_column("配置名称", style="cyan")
+    config_table.add_column("状态", style="green")
+
+    for i, config_name in enumerate(configs, 1):
+        config_table.add_row(str(i), config_name, "✅ 可用")
+
+    config_panel = Panel(
+        config_table,
+        title=f"[bold cyan]{config_type} 配置列表[/bold cyan]",
+        border_style="cyan",
+        width=80
+    )
+    return Align.center(config_panel)
+
+
+# 分享说明文本模板
+_DNS_INSTRUCTIONS = """🌐 DNS 配置说明
+
+请在您的 DNS 服务商管理面板中添加以下 TXT 记录:
+
+📋 记录信息:
+• 记录类型: TXT
+• 主机记录: {host_record}
+• 记录值: {record_value}
+• TTL: {ttl} (或使用默认值)
+
+✅ 设置完成后的效果:
+客户端可以通过域名 {domain} 自动获取连接配置，无需手动输入服务器信息。
+
+⏰ 重要提醒:
+DNS 记录生效通常需要 5-30 分钟，某些情况下可能需要几小时。
+建议使用在线 DNS 查询工具验证记录是否生效。
+
+💡 常见 DNS 服务商设置方法:
+• 阿里云: 云解析 DNS → 解析设置 → 添加记录
+• 腾讯云: DNSPod → 我的域名 → 添加记录
+• Cloudflare: DNS → Records → Add record"""
+
+_EDGE_LINK_INSTRUCTIONS = """🔗 Edge 链接分享
+
+这是一个包含完整配置信息的 edge:// 链接，可以直接分享给客户端用户：
+
+📋 Edge 链接:
+{edge_link}
+
+✅ 使用方法:
+1. 将此链接发送给需要连接的用户
+2. 用户在客户端选择"从 Edge 链接导入配置"
+3. 粘贴此链接即可自动配置连接
+
+💡 优势:
+• 无需配置 DNS 记录
+• 即时生效，无需等待 DNS 传播
+• 包含完整的连接信息
+• 便于通过聊天工具分享
+
+⚠️ 注意事项:
+• 请妥善保管此链接，避免泄露给未授权用户
+• 链接包含服务器的完整连接信息"""
+
+
+# DNS 记录主机名提示
+_HOST_RECORD_HINT = (
+    "\n[dim]💡 主机记录名称: {host_record}[/dim]\n"
+    "[dim]（如需复制主机记录名称，请手动选择复制）[/dim]"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_dns_panel(domain: str, host_record: str, record_value: str, ttl: int) -> Align:
+    """
+    构建 DNS 配置说明面板，同一记录重复显示时直接复用
+    
+    Args:
+        domain: 域名
+        host_record: 主机记录
+        record_value: 记录值
+        ttl: TTL
+        
+    Returns:
+        居中的说明面板
+    """
+    instructions = _DNS_INSTRUCTIONS.format(
+        domain=domain, host_record=host_record, record_value=record_value, ttl=ttl
+    )
+    dns_panel = Panel(
+        instructions,
+        title="[bold green]DNS 配置说明[/bold green]",
+        border_style="green",
+        width=100
+    )
+    return Align.center(dns_panel)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_edge_link_panel(edge_link: str) -> Align:
+    """
+    构建 Edge 链接说明面板，同一链接重复显示时直接复用
+    
+    Args:
+        edge_link: Edge 链接
+        
+    Returns:
+        居中的说明面板
+    """
+    edge_panel = Panel(
+        _EDGE_LINK_INSTRUCTIONS.format(edge_link=edge_link),
+        title="[bold blue]Edge 链接配置[/bold blue]",
+        border_style="blue",
+        width=100
+    )
+    return Align.center(edge_panel)
 
 
 class Display:
@@ -19,68 +243,19 @@ class Display:
     @staticmethod
     def show_banner():
         """显示欢迎横幅"""
-        banner_text = Text()
-        banner_text.append("EdgeCLI", style="bold bright_blue")
-        banner_text.append(" - Minecraft 代理工具", style="bright_white")
-
-        subtitle = Text("基于 XRay 的高性能代理解决方案", style="dim cyan")
-
-        banner_content = Align.center(banner_text + "\n" + subtitle)
-
-        banner_panel = Panel(
-            banner_content,
-            border_style="bright_blue",
-            padding=(1, 2),
-            width=80
-        )
-
         console.print("\n")
-        console.print(Align.center(banner_panel))
+        console.print(_BANNER)
         console.print()
     
     @staticmethod
     def show_main_menu():
         """显示主菜单"""
-        menu_table = Table(show_header=False, box=None, padding=(0, 2))
-        menu_table.add_column("选项", style="bold cyan", width=8)
-        menu_table.add_column("说明", style="white")
-
-        menu_table.add_row("1", "🖥️  服务端模式 - 创建 Minecraft 代理服务器")
-        menu_table.add_row("2", "💻 客户端模式 - 连接到代理服务器")
-        menu_table.add_row("3", "⚙️  工具设置")
-        menu_table.add_row("0", "❌ 退出程序")
-
-        menu_panel = Panel(
-            menu_table,
-            title="[bold green]主菜单[/bold green]",
-            border_style="green",
-            padding=(1, 1),
-            width=80
-        )
-
-        console.print(Align.center(menu_panel))
+        console.print(_MAIN_MENU)
     
     @staticmethod
     def show_settings_menu():
         """显示设置菜单"""
-        settings_table = Table(show_header=False, box=None, padding=(0, 2))
-        settings_table.add_column("选项", style="bold cyan", width=8)
-        settings_table.add_column("说明", style="white")
-
-        settings_table.add_row("1", "📁 查看配置文件")
-        settings_table.add_row("2", "🗑️  删除配置文件")
-        settings_table.add_row("3", "📊 系统信息")
-        settings_table.add_row("0", "🔙 返回主菜单")
-
-        settings_panel = Panel(
-            settings_table,
-            title="[bold yellow]工具设置[/bold yellow]",
-            border_style="yellow",
-            padding=(1, 1),
-            width=80
-        )
-
-        console.print(Align.center(settings_panel))
+        console.print(_SETTINGS_MENU)
     
     @staticmethod
     def show_config_list(configs: List[str], config_type: str):
@@ -95,21 +270,7 @@ class Display:
             console.print(f"[yellow]暂无 {config_type} 配置文件[/yellow]")
             return
 
-        config_table = Table(show_header=True, header_style="bold magenta", width=70)
-        config_table.add_column("序号", style="dim", width=6)
-        config_table.add_column("配置名称", style="cyan")
-        config_table.add_column("状态", style="green")
-
-        for i, config_name in enumerate(configs, 1):
-            config_table.add_row(str(i), config_name, "✅ 可用")
-
-        config_panel = Panel(
-            config_table,
-            title=f"[bold cyan]{config_type} 配置列表[/bold cyan]",
-            border_style="cyan",
-            width=80
-        )
-        console.print(Align.center(config_panel))
+        console.print(_build_config_list(tuple(configs), config_type))
     
     @staticmethod
     def show_system_info(info: Dict[str, Any]):
@@ -143,24 +304,7 @@ class Display:
         console.print("\n[bold cyan]📤 配置分享选项[/bold cyan]")
         console.print("[dim]请选择您希望使用的配置分享方式:[/dim]\n")
         
-        # 创建选项表格
-        options_table = Table(show_header=False, box=None, padding=(0, 2))
-        options_table.add_column("选项", style="bold cyan", width=8)
-        options_table.add_column("说明", style="white")
-        
-        options_table.add_row("1", "🌐 DNS TXT 记录 - 通过域名自动获取配置")
-        options_table.add_row("2", "🔗 Edge 链接 - 直接分享配置链接")
-        options_table.add_row("3", "📋 显示所有方式")
-        
-        options_panel = Panel(
-            options_table,
-            title="[bold green]分享方式[/bold green]",
-            border_style="green",
-            padding=(1, 1),
-            width=80
-        )
-        
-        console.print(Align.center(options_panel))
+        console.print(_SHARING_OPTIONS)
     
     @staticmethod
     def show_dns_instructions(dns_record_info: Dict[str, Any]):
@@ -170,41 +314,13 @@ class Display:
         Args:
             dns_record_info: DNS 记录信息字典
         """
-        domain = dns_record_info["domain"]
-        host_record = dns_record_info["host_record"]
-        record_value = dns_record_info["record_value"]
-        ttl = dns_record_info["ttl"]
-
-        instructions = f"""🌐 DNS 配置说明
-
-请在您的 DNS 服务商管理面板中添加以下 TXT 记录:
-
-📋 记录信息:
-• 记录类型: TXT
-• 主机记录: {host_record}
-• 记录值: {record_value}
-• TTL: {ttl} (或使用默认值)
-
-✅ 设置完成后的效果:
-客户端可以通过域名 {domain} 自动获取连接配置，无需手动输入服务器信息。
-
-⏰ 重要提醒:
-DNS 记录生效通常需要 5-30 分钟，某些情况下可能需要几小时。
-建议使用在线 DNS 查询工具验证记录是否生效。
-
-💡 常见 DNS 服务商设置方法:
-• 阿里云: 云解析 DNS → 解析设置 → 添加记录
-• 腾讯云: DNSPod → 我的域名 → 添加记录
-• Cloudflare: DNS → Records → Add record"""
-
-        dns_panel = Panel(
-            instructions,
-            title="[bold green]DNS 配置说明[/bold green]",
-            border_style="green",
-            width=100
-        )
         console.print("\n")
-        console.print(Align.center(dns_panel))
+        console.print(_build_dns_panel(
+            dns_record_info["domain"],
+            dns_record_info["host_record"],
+            dns_record_info["record_value"],
+            dns_record_info["ttl"]
+        ))
     
     @staticmethod
     def show_edge_link_instructions(edge_link: str):
@@ -214,36 +330,41 @@ DNS 记录生效通常需要 5-30 分钟，某些情况下可能需要几小时
         Args:
             edge_link: Edge 链接
         """
-        instructions = f"""🔗 Edge 链接分享
-
-这是一个包含完整配置信息的 edge:// 链接，可以直接分享给客户端用户：
-
-📋 Edge 链接:
-{edge_link}
-
-✅ 使用方法:
-1. 将此链接发送给需要连接的用户
-2. 用户在客户端选择"从 Edge 链接导入配置"
-3. 粘贴此链接即可自动配置连接
-
-💡 优势:
-• 无需配置 DNS 记录
-• 即时生效，无需等待 DNS 传播
-• 包含完整的连接信息
-• 便于通过聊天工具分享
-
-⚠️ 注意事项:
-• 请妥善保管此链接，避免泄露给未授权用户
-• 链接包含服务器的完整连接信息"""
-
-        edge_panel = Panel(
-            instructions,
-            title="[bold blue]Edge 链接配置[/bold blue]",
-            border_style="blue",
-            width=100
-        )
         console.print("\n")
-        console.print(Align.center(edge_panel))
+        console.print(_build_edge_link_panel(edge_link))
+    
+    @staticmethod
+    def show_host_record_hint(host_record: str):
+        """
+        显示 DNS 主机记录名称提示
+        
+        Args:
+            host_record: 主机记录
+        """
+        console.print(_HOST_RECORD_HINT.format(host_record=host_record))
+    
+    @staticmethod
+    def show_all_sharing_instructions(dns_record_info: Dict[str, Any], edge_link: str):
+        """
+        一次性显示 DNS TXT 记录与 Edge 链接两种分享方式
+        
+        Args:
+            dns_record_info: DNS 记录信息字典
+            edge_link: Edge 链接
+        """
+        console.print(Group(
+            Text.from_markup("\n[bold yellow]📋 DNS TXT 记录方式:[/bold yellow]\n\n"),
+            _build_dns_panel(
+                dns_record_info["domain"],
+                dns_record_info["host_record"],
+                dns_record_info["record_value"],
+                dns_record_info["ttl"]
+            ),
+            Text.from_markup(_HOST_RECORD_HINT.format(host_record=dns_record_info["host_record"])),
+            Text("\n" + "=" * 80),
+            Text.from_markup("\n[bold yellow]🔗 Edge 链接方式:[/bold yellow]\n\n"),
+            _build_edge_link_panel(edge_link)
+        ))
     
     @staticmethod
     def show_config_summary(config_data: Dict[str, Any]):
@@ -259,9 +380,7 @@ DNS 记录生效通常需要 5-30 分钟，某些情况下可能需要几小时
         summary_table.add_column("值", style="white")
 
         for key, value in config_data.items():
-            if isinstance(value, str) and len(value) > 50:
-                value = value[:47] + "..."
-            summary_table.add_row(key, str(value))
+            summary_table.add_row(key, _truncate(str(value)))
 
         console.print(summary_table)
     
@@ -277,6 +396,18 @@ DNS 记录生效通常需要 5-30 分钟，某些情况下可能需要几小时
         title_text = Text(title, style=style)
         console.print(Panel(Align.center(title_text), border_style="cyan", padding=(1, 2)))
     
+    @staticmethod
+    def begin_section(title: str):
+        """
+        以分隔线开始一个新的界面段落（不清屏）
+        
+        Args:
+            title: 段落标题
+        """
+        console.print()
+        console.rule(f"[bold cyan]{title}[/bold cyan]", style="cyan")
+        console.print()
+    
     @staticmethod
     def show_status(message: str, status_type: str = "info"):
         """
@@ -3,12 +3,106 @@ Input Handler
 输入处理器 - 提供用户输入处理功能
 """
 
-from rich.console import Console
+import functools
 from rich.prompt import Prompt, Confirm
-from typing import Optional, List, Callable, Any
-from ...backend.utils.validation_utils import ValidationUtils
+from typing import Optional, List, Callable, Any, Dict, FrozenSet, NamedTuple, Tuple
+from ...backend.utils.validation_utils import (
+    parse_port, validate_config_name, validate_domain, validate_ip_address
+)
+from .console import console
 
-console = Console()
+# 配置菜单可识别的文字指令（客户端额外支持 edge）
+_CLIENT_TYPES = frozenset(("client", "客户端"))
+_CLIENT_COMMANDS = frozenset(("new", "back", "edge"))
+_SERVER_COMMANDS = frozenset(("new", "back"))
+
+# 配置菜单的错误提示，按是否允许 edge 指令区分
+_INVALID_INDEX_MSG = "[red]❌ 无效的序号，请重新输入[/red]"
+_INVALID_CHOICE_MSGS = {
+    True: "[red]❌ 请输入有效的数字或 'new', 'back', 'edge'[/red]",
+    False: "[red]❌ 请输入有效的数字或 'new', 'back'[/red]",
+}
+_INVALID_COMMAND_MSGS = {
+    True: "[red]❌ 请输入 'new', 'back', 'edge'[/red]",
+    False: "[red]❌ 请输入 'new', 'back'[/red]",
+}
+
+
+class FieldSpec(NamedTuple):
+    """表单字段定义"""
+    name: str
+    prompt: str
+    validator: Callable[[str], bool]
+    error_message: str
+    default: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=128)
+def _cyan(prompt: str) -> str:
+    """为普通输入提示添加样式"""
+    return f"[cyan]{prompt}[/cyan]"
+
+
+@functools.lru_cache(maxsize=128)
+def _bold_cyan(prompt: str) -> str:
+    """为菜单选择提示添加样式"""
+    return f"\n[bold cyan]{prompt}[/bold cyan]"
+
+
+_SELECT_ACTION_PROMPT = _bold_cyan("请选择操作")
+
+# CryptoService 依赖 cryptography，导入较慢，首次输入 Edge 链接时再加载
+_CryptoService = None
+
+
+def _get_crypto():
+    """导入并缓存 CryptoService"""
+    global _CryptoService
+    if _CryptoService is None:
+        from ...backend.services.crypto_service import CryptoService
+        _CryptoService = CryptoService
+    return _CryptoService
+
+
+@functools.lru_cache(maxsize=8)
+def _digit_choice_prompt(prompt: str, choices: Tuple[str, ...],
+                         default: str) -> Tuple[str, FrozenSet[str]]:
+    """
+    构建数字菜单的提示文本与可选项集合，样式与 Rich 的 Prompt 保持一致
+    
+    Args:
+        prompt: 提示信息
+        choices: 可选项
+        default: 默认值
+        
+    Returns:
+        (提示文本, 可选项集合)
+    """
+    text = (f"{_bold_cyan(prompt)} [bold magenta][{'/'.join(choices)}][/bold magenta] "
+            f"[bold cyan]({default})[/bold cyan]: ")
+    return text, frozenset(choices)
+
+
+@functools.lru_cache(maxsize=4)
+def _menu_options_text(has_configs: bool, allow_edge: bool) -> str:
+    """
+    构建配置菜单的选项说明，整体一次输出
+    
+    Args:
+        has_configs: 是否已有配置可供选择
+        allow_edge: 是否允许从 Edge 链接导入
+        
+    Returns:
+        选项说明文本
+    """
+    lines = ["\n[bold yellow]选项:[/bold yellow]"]
+    if has_configs:
+        lines.append("• 输入序号选择现有配置")
+    lines.append("• 输入 'new' 创建新配置")
+    if allow_edge:
+        lines.append("• 输入 'edge' 从 Edge 链接导入配置")
+    lines.append("• 输入 'back' 返回主菜单")
+    return "\n".join(lines)
 
 
 class InputHandler:
@@ -16,7 +110,10 @@ class InputHandler:
     
     def __init__(self):
         """初始化输入处理器"""
-        self.validation_utils = ValidationUtils()
+        # 校验函数为模块级函数，只绑定一次，重试循环中直接调用
+        self._validate_domain = validate_domain
+        self._validate_ip = validate_ip_address
+        self._validate_config_name = validate_config_name
     
     def get_text_input(self, prompt: str, default: str = None, required: bool = True) -> Optional[str]:
         """
@@ -30,8 +127,14 @@ class InputHandler:
         Returns:
             用户输入的文本或 None
         """
+        # 非空默认值只需处理一次，直接回车时原样返回
+        default_value = default.strip() if default else None
+        
         while True:
-            value = Prompt.ask(f"[cyan]{prompt}[/cyan]", default=default)
+            value = Prompt.ask(_cyan(prompt), default=default, console=console)
+            
+            if default_value and value == default:
+                return default_value
             
             if not required and not value:
                 return None
@@ -45,7 +148,8 @@ class InputHandler:
                 return None
     
     def get_validated_input(self, prompt: str, validator: Callable[[str], bool], 
-                          error_message: str, default: str = None) -> str:
+                          error_message: str, default: str = None,
+                          default_is_valid: bool = False) -> str:
         """
         获取经过验证的输入
         
@@ -54,34 +158,41 @@ class InputHandler:
             validator: 验证函数
             error_message: 错误消息
             default: 默认值
+            default_is_valid: 默认值是否已知有效，为真时直接接受默认值而不再验证
             
         Returns:
             验证通过的输入
         """
         while True:
-            value = Prompt.ask(f"[cyan]{prompt}[/cyan]", default=default)
+            value = Prompt.ask(_cyan(prompt), default=default, console=console)
+            
+            if default_is_valid and value == default:
+                return value
             
             if validator(value):
                 return value
             
             console.print(f"[red]❌ {error_message}[/red]")
     
-    def get_domain_input(self, prompt: str = "域名", default: str = None) -> str:
+    def get_domain_input(self, prompt: str = "域名", default: str = None,
+                         default_is_valid: bool = False) -> str:
         """
         获取域名输入
         
         Args:
             prompt: 提示信息
             default: 默认值
+            default_is_valid: 默认值是否已知有效
             
         Returns:
             有效的域名
         """
         return self.get_validated_input(
             prompt,
-            self.validation_utils.validate_domain,
+            self._validate_domain,
             "请输入有效的域名（如：mc.example.com）",
-            default
+            default,
+            default_is_valid
         )
     
     def get_ip_input(self, prompt: str = "IP 地址", default: str = None) -> str:
@@ -97,29 +208,39 @@ class InputHandler:
         """
         return self.get_validated_input(
             prompt,
-            self.validation_utils.validate_ip_address,
+            self._validate_ip,
             "请输入有效的 IP 地址",
             default
         )
     
-    def get_port_input(self, prompt: str = "端口号", default: str = None) -> int:
+    def get_port_input(self, prompt: str = "端口号", default: str = None,
+                       default_is_valid: bool = False) -> int:
         """
         获取端口号输入
         
         Args:
             prompt: 提示信息
             default: 默认值
+            default_is_valid: 默认值是否已知有效
             
         Returns:
             有效的端口号
         """
-        port_str = self.get_validated_input(
-            prompt,
-            self.validation_utils.validate_port,
-            "请输入有效的端口号 (1-65535)",
-            default
-        )
-        return int(port_str)
+        # 已知有效的默认值在循环外解析一次，直接回车时无需再解析
+        default_port = int(default) if default_is_valid else None
+        
+        while True:
+            value = Prompt.ask(_cyan(prompt), default=default, console=console)
+            
+            if default_port is not None and value == default:
+                return default_port
+            
+            # 解析与验证合为一步，得到的端口号直接返回
+            port = parse_port(value)
+            if port is not None:
+                return port
+            
+            console.print("[red]❌ 请输入有效的端口号 (1-65535)[/red]")
     
     def get_config_name_input(self, prompt: str = "配置名称") -> str:
         """
@@ -133,7 +254,7 @@ class InputHandler:
         """
         return self.get_validated_input(
             prompt,
-            self.validation_utils.validate_config_name,
+            self._validate_config_name,
             "配置名称只能包含字母、数字、下划线和连字符",
             None
         )
@@ -151,11 +272,55 @@ class InputHandler:
             用户选择
         """
         return Prompt.ask(
-            f"\n[bold cyan]{prompt}[/bold cyan]",
+            _bold_cyan(prompt),
             choices=choices,
-            default=default
+            default=default,
+            console=console
         )
     
+    def collect_form(self, fields: List[FieldSpec]) -> Dict[str, str]:
+        """
+        按顺序读取表单的全部字段，每个字段输入后立即验证，无效时只重新询问该字段
+        
+        Args:
+            fields: 字段定义列表
+            
+        Returns:
+            字段名到输入值的映射
+        """
+        values = {}
+        for field in fields:
+            values[field.name] = self.get_validated_input(
+                field.prompt, field.validator, field.error_message, field.default
+            )
+        return values
+    
+    def get_digit_choice(self, prompt: str, choices: Tuple[str, ...], default: str) -> str:
+        """
+        获取数字菜单选择
+        
+        主菜单等固定的小型菜单无需 Prompt.ask 的通用处理，
+        直接读取一行并做集合判断。
+        
+        Args:
+            prompt: 提示信息
+            choices: 可选项
+            default: 默认值（直接回车时使用）
+            
+        Returns:
+            用户选择
+        """
+        text, valid = _digit_choice_prompt(prompt, choices, default)
+        
+        while True:
+            console.print(text, end="")
+            # input() 在输入结束时抛出 EOFError，与 Prompt.ask 行为一致
+            choice = input().strip() or default
+            if choice in valid:
+                return choice
+            
+            console.print("[red]❌ 请输入有效的选项[/red]")
+    
     def get_confirmation(self, prompt: str, default: bool = True) -> bool:
         """
         获取确认输入
@@ -167,7 +332,7 @@ class InputHandler:
         Returns:
             用户确认结果
         """
-        return Confirm.ask(f"[cyan]{prompt}[/cyan]", default=default)
+        return Confirm.ask(_cyan(prompt), default=default, console=console)
     
     def get_edge_link_input(self, prompt: str = "Edge 链接") -> str:
         """
@@ -179,11 +344,9 @@ class InputHandler:
         Returns:
             有效的 Edge 链接
         """
-        from ...backend.services.crypto_service import CryptoService
-        
         return self.get_validated_input(
             prompt,
-            CryptoService.validate_edge_link,
+            _get_crypto().validate_edge_link,
             "请输入有效的 edge:// 链接",
             None
         )
@@ -199,63 +362,47 @@ class InputHandler:
         Returns:
             选择的配置名称或特殊选项
         """
+        allow_edge = config_type in _CLIENT_TYPES
+        commands = _CLIENT_COMMANDS if allow_edge else _SERVER_COMMANDS
+        
         if configs:
-            console.print("\n[bold yellow]选项:[/bold yellow]")
-            console.print("• 输入序号选择现有配置")
-            console.print("• 输入 'new' 创建新配置")
-            if config_type == "client" or config_type == "客户端":
-                console.print("• 输入 'edge' 从 Edge 链接导入配置")
-            console.print("• 输入 'back' 返回主菜单")
+            console.print(_menu_options_text(True, allow_edge))
 
             while True:
                 choice = Prompt.ask(
-                    "\n[bold cyan]请选择操作[/bold cyan]",
-                    default="new"
+                    _SELECT_ACTION_PROMPT,
+                    default="new",
+                    console=console
                 )
 
-                if choice.lower() == 'back':
-                    return None
-                elif choice.lower() == 'new':
-                    return 'new'
-                elif choice.lower() == 'edge' and (config_type == "client" or config_type == "客户端"):
-                    return 'edge'
+                command = choice.lower()
+                if command in commands:
+                    return None if command == 'back' else command
 
                 try:
                     index = int(choice) - 1
                     if 0 <= index < len(configs):
                         return configs[index]
                     else:
-                        console.print("[red]❌ 无效的序号，请重新输入[/red]")
+                        console.print(_INVALID_INDEX_MSG)
                 except ValueError:
-                    valid_options = ["'new'", "'back'"]
-                    if config_type == "client" or config_type == "客户端":
-                        valid_options.append("'edge'")
-                    console.print(f"[red]❌ 请输入有效的数字或 {', '.join(valid_options)}[/red]")
+                    console.print(_INVALID_CHOICE_MSGS[allow_edge])
         else:
-            console.print(f"[yellow]📝 暂无{config_type}配置[/yellow]")
-            console.print("\n[bold yellow]选项:[/bold yellow]")
-            console.print("• 输入 'new' 创建新配置")
-            if config_type == "client" or config_type == "客户端":
-                console.print("• 输入 'edge' 从 Edge 链接导入配置")
-            console.print("• 输入 'back' 返回主菜单")
+            console.print(f"[yellow]📝 暂无{config_type}配置[/yellow]\n"
+                          + _menu_options_text(False, allow_edge))
             
             while True:
                 choice = Prompt.ask(
-                    "\n[bold cyan]请选择操作[/bold cyan]",
-                    default="new"
+                    _SELECT_ACTION_PROMPT,
+                    default="new",
+                    console=console
                 )
                 
-                if choice.lower() == 'back':
-                    return None
-                elif choice.lower() == 'new':
-                    return 'new'
-                elif choice.lower() == 'edge' and (config_type == "client" or config_type == "客户端"):
-                    return 'edge'
+                command = choice.lower()
+                if command in commands:
+                    return None if command == 'back' else command
                 else:
-                    valid_options = ["'new'", "'back'"]
-                    if config_type == "client" or config_type == "客户端":
-                        valid_options.append("'edge'")
-                    console.print(f"[red]❌ 请输入 {', '.join(valid_options)}[/red]")
+                    console.print(_INVALID_COMMAND_MSGS[allow_edge])
     
     def wait_for_enter(self, message: str = "按回车键继续") -> None:
         """
@@ -264,4 +411,4 @@ class InputHandler:
         Args:
             message: 提示消息
         """
-        Prompt.ask(f"\n{message}", default="")
+        Prompt.ask(f"\n{message}", default="", console=console)
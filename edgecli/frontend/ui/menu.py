@@ -3,12 +3,34 @@ Menu Components
 菜单组件 - 提供各种菜单功能
 """
 
-from rich.console import Console
+import functools
 from typing import Dict, Any, List, Optional, Callable
 from .display import Display
-from .input_handler import InputHandler
+from .input_handler import FieldSpec, InputHandler
+from ...backend.utils.validation_utils import (
+    validate_config_name, validate_domain, validate_ip_address, validate_port
+)
+from .console import console
 
-console = Console()
+# 固定数字菜单的可选项
+_MAIN_MENU_CHOICES = ("0", "1", "2", "3")
+_SETTINGS_MENU_CHOICES = ("0", "1", "2", "3")
+_SHARING_MENU_CHOICES = ("1", "2", "3")
+
+# 自签名证书可选的密钥类型，第一个为默认值
+_CERT_KEY_TYPES = ["ec", "ed25519"]
+
+# 服务端配置向导的表单字段
+_SERVER_WIZARD_FIELDS = [
+    FieldSpec("name", "配置名称 (用于标识此配置)", validate_config_name,
+              "配置名称只能包含字母、数字、下划线和连字符"),
+    FieldSpec("frontend_host", "前端域名", validate_domain,
+              "请输入有效的域名（如：mc.example.com）"),
+    FieldSpec("backend_ip", "后端服务器 IP", validate_ip_address,
+              "请输入有效的 IP 地址"),
+    FieldSpec("backend_port", "后端服务器端口", validate_port,
+              "请输入有效的端口号 (1-65535)", "25565"),
+]
 
 
 class Menu:
@@ -28,9 +50,9 @@ class Menu:
         """
         self.display.show_main_menu()
         
-        return self.input_handler.get_choice_input(
+        return self.input_handler.get_digit_choice(
             "请选择操作",
-            ["0", "1", "2", "3"],
+            _MAIN_MENU_CHOICES,
             "1"
         )
     
@@ -43,9 +65,9 @@ class Menu:
         """
         self.display.show_settings_menu()
         
-        return self.input_handler.get_choice_input(
+        return self.input_handler.get_digit_choice(
             "请选择操作",
-            ["0", "1", "2", "3"],
+            _SETTINGS_MENU_CHOICES,
             "0"
         )
     
@@ -76,9 +98,9 @@ class Menu:
         """
         self.display.show_sharing_options()
         
-        return self.input_handler.get_choice_input(
+        return self.input_handler.get_digit_choice(
             "请选择分享方式",
-            ["1", "2", "3"],
+            _SHARING_MENU_CHOICES,
             "3"
         )
     
@@ -89,30 +111,29 @@ class Menu:
         Returns:
             配置数据字典或 None
         """
-        console.clear()
-        self.display.show_title("🆕 创建 Minecraft 代理服务端配置")
+        self.display.begin_section("🆕 创建 Minecraft 代理服务端配置")
         
         console.print("[bold yellow]📝 请按照提示输入配置信息:[/bold yellow]\n")
         
-        # 获取配置名称
-        config_name = self.input_handler.get_config_name_input("配置名称 (用于标识此配置)")
+        # 字段说明一次性输出，随后依次读取各字段
+        console.print("[dim]🌐 前端域名：客户端连接的域名，需要指向您的服务器\n"
+                      "🎮 后端服务器：实际的 Minecraft 服务器地址[/dim]")
         
-        # 获取前端域名
-        console.print("\n[bold blue]🌐 前端域名配置[/bold blue]")
-        console.print("[dim]这是客户端连接的域名，需要指向您的服务器[/dim]")
-        frontend_host = self.input_handler.get_domain_input("前端域名")
+        values = self.input_handler.collect_form(_SERVER_WIZARD_FIELDS)
         
-        # 获取后端配置
-        console.print("\n[bold green]🎮 后端 Minecraft 服务器配置[/bold green]")
-        console.print("[dim]这是实际的 Minecraft 服务器地址[/dim]")
-        backend_ip = self.input_handler.get_ip_input("后端服务器 IP")
-        backend_port = self.input_handler.get_port_input("后端服务器端口", "25565")
+        # Ed25519 生成更快，但部分 CDN 回源时不接受 Ed25519 证书
+        key_type = self.input_handler.get_choice_input(
+            "证书密钥类型 (ed25519 生成更快，部分 CDN 不支持)",
+            _CERT_KEY_TYPES,
+            _CERT_KEY_TYPES[0]
+        )
         
         return {
-            "name": config_name,
-            "frontend_host": frontend_host,
-            "backend_ip": backend_ip,
-            "backend_port": backend_port
+            "name": values["name"],
+            "frontend_host": values["frontend_host"],
+            "backend_ip": values["backend_ip"],
+            "backend_port": int(values["backend_port"]),
+            "key_type": key_type
         }
     
     def create_client_config_wizard(self) -> Optional[Dict[str, Any]]:
@@ -122,8 +143,7 @@ class Menu:
         Returns:
             配置数据字典或 None
         """
-        console.clear()
-        self.display.show_title("🆕 创建 Minecraft 代理客户端配置")
+        self.display.begin_section("🆕 创建 Minecraft 代理客户端配置")
         
         console.print("[bold yellow]📝 请按照提示输入配置信息:[/bold yellow]\n")
         
@@ -138,7 +158,7 @@ class Menu:
         # 获取本地监听端口
         console.print("\n[bold green]🎮 本地 Minecraft 配置[/bold green]")
         console.print("[dim]这是您的 Minecraft 客户端连接的本地端口[/dim]")
-        local_port = self.input_handler.get_port_input("本地监听端口", "25565")
+        local_port = self.input_handler.get_port_input("本地监听端口", "25565", default_is_valid=True)
         
         return {
             "name": config_name,
@@ -153,8 +173,7 @@ class Menu:
         Returns:
             配置数据字典或 None
         """
-        console.clear()
-        self.display.show_title("🔗 从 Edge 链接导入配置")
+        self.display.begin_section("🔗 从 Edge 链接导入配置")
         
         console.print("[bold yellow]📝 请按照提示输入配置信息:[/bold yellow]\n")
         
@@ -169,7 +188,7 @@ class Menu:
         # 获取本地监听端口
         console.print("\n[bold green]🎮 本地 Minecraft 配置[/bold green]")
         console.print("[dim]这是您的 Minecraft 客户端连接的本地端口[/dim]")
-        local_port = self.input_handler.get_port_input("本地监听端口", "25565")
+        local_port = self.input_handler.get_port_input("本地监听端口", "25565", default_is_valid=True)
         
         return {
             "name": config_name,
@@ -209,7 +228,7 @@ class Menu:
         
         client_id = self.input_handler.get_text_input("客户端 ID")
         protocol = self.input_handler.get_text_input("协议", "vless")
-        port = self.input_handler.get_port_input("端口", "443")
+        port = self.input_handler.get_port_input("端口", "443", default_is_valid=True)
         path = self.input_handler.get_text_input("路径", "/mcproxy")
         
         return {
@@ -229,3 +248,14 @@ class Menu:
         """
         console.print("\n\n[yellow]⚠️  程序被用户中断[/yellow]")
         return self.input_handler.get_confirmation("是否退出程序？", True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_menu() -> Menu:
+    """
+    获取进程内共享的菜单组件
+    
+    Returns:
+        菜单组件实例
+    """
+    return Menu()
@@ -4,5 +4,6 @@ Frontend Utils Module
 """
 
 from .clipboard_utils import ClipboardUtils
+from .signal_utils import StopWaiter
 
-__all__ = ['ClipboardUtils']
+__all__ = ['ClipboardUtils', 'StopWaiter']
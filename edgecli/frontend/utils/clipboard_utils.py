@@ -3,9 +3,34 @@ Clipboard Utils
 剪贴板工具 - 提供剪贴板操作功能
 """
 
-from rich.console import Console
+import functools
+import shutil
+import subprocess
+import sys
+import threading
+from typing import List, Optional
 
-console = Console()
+try:
+    import pyperclip
+except ImportError:  # 可选依赖，缺失时提示手动复制
+    pyperclip = None
+
+from ..ui.console import console
+
+# 尚未完成的后台复制线程
+_pending_copies: List[threading.Thread] = []
+_pending_lock = threading.Lock()
+
+# 通过 xclip 写入剪贴板时每次写入的字节数
+_CLIPBOARD_CHUNK_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def _find_xclip() -> Optional[str]:
+    """查找 xclip 可执行文件（仅 Linux）"""
+    if not sys.platform.startswith("linux"):
+        return None
+    return shutil.which("xclip")
 
 
 class ClipboardUtils:
@@ -23,17 +48,52 @@ class ClipboardUtils:
             是否成功
         """
         try:
-            import pyperclip
+            if ClipboardUtils._write_chunked(text):
+                return True
+            if pyperclip is None:
+                console.print("[yellow]⚠️  pyperclip 模块未安装，无法使用剪贴板功能[/yellow]")
+                console.print("[dim]提示: 运行 'pip install pyperclip' 安装剪贴板支持[/dim]")
+                return False
             pyperclip.copy(text)
             return True
-        except ImportError:
-            console.print("[yellow]⚠️  pyperclip 模块未安装，无法使用剪贴板功能[/yellow]")
-            console.print("[dim]提示: 运行 'pip install pyperclip' 安装剪贴板支持[/dim]")
-            return False
         except Exception as e:
             console.print(f"[red]❌ 复制到剪贴板失败: {str(e)}[/red]")
             return False
     
+    @staticmethod
+    def _write_chunked(text: str) -> bool:
+        """
+        通过 xclip 分块写入剪贴板，不可用时交由 pyperclip 处理
+        
+        Args:
+            text: 要复制的文本
+            
+        Returns:
+            是否已写入
+        """
+        xclip = _find_xclip()
+        if xclip is None:
+            return False
+        
+        data = text.encode('utf-8')
+        try:
+            process = subprocess.Popen(
+                [xclip, "-selection", "clipboard", "-i"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                bufsize=_CLIPBOARD_CHUNK_SIZE
+            )
+            try:
+                for start in range(0, len(data), _CLIPBOARD_CHUNK_SIZE):
+                    process.stdin.write(data[start:start + _CLIPBOARD_CHUNK_SIZE])
+            finally:
+                process.stdin.close()
+            return process.wait() == 0
+        except OSError:
+            # xclip 无法运行（如无 X 会话），回退到 pyperclip
+            return False
+    
     @staticmethod
     def get_from_clipboard() -> str:
         """
@@ -42,12 +102,12 @@ class ClipboardUtils:
         Returns:
             剪贴板文本内容
         """
-        try:
-            import pyperclip
-            return pyperclip.paste()
-        except ImportError:
+        if pyperclip is None:
             console.print("[yellow]⚠️  pyperclip 模块未安装，无法使用剪贴板功能[/yellow]")
             return ""
+        
+        try:
+            return pyperclip.paste()
         except Exception as e:
             console.print(f"[red]❌ 从剪贴板读取失败: {str(e)}[/red]")
             return ""
@@ -90,3 +150,40 @@ class ClipboardUtils:
         else:
             console.print(f"[yellow]⚠️ 自动复制失败，请手动复制{description}[/yellow]")
             return False
+    
+    @staticmethod
+    def copy_async(text: str, description: str = "内容") -> threading.Thread:
+        """
+        在后台线程中复制并显示反馈，不阻塞界面渲染
+        
+        Args:
+            text: 要复制的文本
+            description: 描述信息
+            
+        Returns:
+            执行复制的线程
+        """
+        thread = threading.Thread(
+            target=ClipboardUtils.copy_with_simple_feedback,
+            args=(text, description),
+            daemon=True
+        )
+        with _pending_lock:
+            _pending_copies[:] = [t for t in _pending_copies if t.is_alive()]
+            _pending_copies.append(thread)
+        thread.start()
+        return thread
+    
+    @staticmethod
+    def wait_for_pending(timeout: Optional[float] = 1.0) -> None:
+        """
+        等待后台复制完成，确保退出前剪贴板已写入
+        
+        Args:
+            timeout: 每个线程的最长等待时间（秒）
+        """
+        with _pending_lock:
+            threads = list(_pending_copies)
+            _pending_copies.clear()
+        for thread in threads:
+            thread.join(timeout)
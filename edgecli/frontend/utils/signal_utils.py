@@ -0,0 +1,74 @@
+"""
+Signal Utils
+信号工具 - 提供可被关闭信号即时唤醒的等待功能
+"""
+
+import select
+import signal
+import socket
+import threading
+
+
+class StopWaiter:
+    """停止等待器：XRay 退出或收到关闭信号时立即唤醒主线程"""
+    
+    def __init__(self):
+        """初始化停止等待器"""
+        self._event = threading.Event()
+        
+        # socketpair 在 Windows 上同样可用于 select 和 set_wakeup_fd
+        self._rsock, self._wsock = socket.socketpair()
+        self._rsock.setblocking(False)
+        self._wsock.setblocking(False)
+    
+    def set(self) -> None:
+        """标记停止并唤醒等待方（可在任意线程调用）"""
+        self._event.set()
+        try:
+            self._wsock.send(b'\0')
+        except OSError:
+            # 缓冲区已满说明已有未读取的唤醒字节
+            pass
+    
+    def clear(self) -> None:
+        """重置停止标记"""
+        self._event.clear()
+        self._drain()
+    
+    def is_set(self) -> bool:
+        """
+        是否已标记停止
+        
+        Returns:
+            是否已标记停止
+        """
+        return self._event.is_set()
+    
+    def _drain(self) -> None:
+        """读空唤醒字节"""
+        try:
+            while self._rsock.recv(4096):
+                pass
+        except OSError:
+            pass
+    
+    def wait(self) -> None:
+        """
+        阻塞直到标记停止
+        
+        等待期间将信号唤醒描述符指向内部 socket，信号到达时 select 立即返回，
+        随后由 Python 执行已注册的信号处理函数。
+        """
+        try:
+            previous_fd = signal.set_wakeup_fd(self._wsock.fileno())
+        except ValueError:
+            # 非主线程无法设置唤醒描述符，仅等待停止标记
+            self._event.wait()
+            return
+        
+        try:
+            while not self._event.is_set():
+                select.select([self._rsock], [], [])
+                self._drain()
+        finally:
+            signal.set_wakeup_fd(previous_fd)